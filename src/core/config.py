@@ -8,31 +8,39 @@ WINDOW_HEIGHT = 720
 WINDOW_TITLE = "Solo Leveling Minecraft"
 FPS = 60
 
+# Debug settings
+DEBUG = False  # Verbose renderer and world logging
+
 # World settings
 CHUNK_SIZE = 16
+assert CHUNK_SIZE & (CHUNK_SIZE - 1) == 0, "CHUNK_SIZE must be a power of two"
+CHUNK_SHIFT = CHUNK_SIZE.bit_length() - 1  # World coord >> CHUNK_SHIFT gives the chunk coord
+CHUNK_MASK = CHUNK_SIZE - 1  # World coord & CHUNK_MASK gives the coord within the chunk
 WORLD_HEIGHT = 256
 RENDER_DISTANCE = 8
+MAX_CACHED_CHUNKS = 2 * (2 * RENDER_DISTANCE + 5) ** 2  # Loaded window plus recently unloaded chunks
 SEA_LEVEL = 64
 
-# Block types
-BLOCK_TYPES = {
-    0: "air",
-    1: "grass",
-    2: "dirt", 
-    3: "stone",
-    4: "wood",
-    5: "leaves",
-    6: "water",
-    7: "sand",
-    8: "gravel",
-    9: "coal_ore",
-    10: "iron_ore",
-    11: "gold_ore",
-    12: "diamond_ore",
-    13: "shadow_stone",  # Solo Leveling special block
-    14: "gate_stone",    # Portal blocks
-    15: "mana_crystal"   # Magic blocks
-}
+# Block types, indexed by block id
+BLOCK_NAMES = (
+    "air",
+    "grass",
+    "dirt",
+    "stone",
+    "wood",
+    "leaves",
+    "water",
+    "sand",
+    "gravel",
+    "coal_ore",
+    "iron_ore",
+    "gold_ore",
+    "diamond_ore",
+    "shadow_stone",  # Solo Leveling special block
+    "gate_stone",    # Portal blocks
+    "mana_crystal"   # Magic blocks
+)
+BLOCK_TYPES = dict(enumerate(BLOCK_NAMES))  # Kept for existing id -> name lookups
 
 # Player settings
 PLAYER_SPEED = 5.0
@@ -44,6 +52,7 @@ PLAYER_WIDTH = 0.6
 # Solo Leveling settings
 HUNTER_RANKS = ["E", "D", "C", "B", "A", "S"]
 MAX_SHADOW_SOLDIERS = 100
+MAX_MONSTERS = 256
 GATE_SPAWN_CHANCE = 0.001
 
 # Controls
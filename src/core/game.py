@@ -2,7 +2,6 @@
 Main game class that manages the game loop and all systems
 """
 
-import pygame
 import moderngl
 import glfw
 import numpy as np
@@ -13,6 +12,7 @@ from ..graphics.renderer import Renderer
 from ..world.world import World
 from ..player.player import Player
 from ..solo_leveling.hunter_system import HunterSystem
+from ..entities.monsters import MonsterPool
 
 class Game:
     """Main game class that handles the game loop."""
@@ -20,9 +20,11 @@ class Game:
     def __init__(self):
         """Initialize the game."""
         self.running = True
-        self.clock = pygame.time.Clock()
         self.delta_time = 0.0
         
+        # Recent frame times for FPS reporting
+        self.frame_times = np.zeros(64, dtype=np.float32)
+        
         # Initialize GLFW
         if not glfw.init():
             raise Exception("Failed to initialize GLFW")
@@ -38,6 +40,7 @@ class Game:
             raise Exception("Failed to create GLFW window")
         
         glfw.make_context_current(self.window)
+        glfw.swap_interval(1)  # Vsync paces the frame loop
         glfw.set_input_mode(self.window, glfw.CURSOR, glfw.CURSOR_DISABLED)
         
         # Set callbacks
@@ -63,6 +66,7 @@ class Game:
         self.world = World()
         self.player = Player()
         self.hunter_system = HunterSystem()
+        self.monsters = MonsterPool()
         
         # Mouse state
         self.first_mouse = True
@@ -97,14 +101,9 @@ class Game:
                 # Swap buffers
                 glfw.swap_buffers(self.window)
                 
-                # Frame rate debugging
+                # Frame rate debugging (reported on F3)
+                self.frame_times[frame_count & 63] = self.delta_time
                 frame_count += 1
-                if frame_count % 60 == 0:  # Print FPS every 60 frames
-                    fps = 60 / (current_time - (last_time - self.delta_time * 60))
-                    print(f"FPS: {fps:.1f}, Player pos: {self.player.position}")
-                
-                # Maintain FPS with a small sleep to prevent CPU spinning
-                self.clock.tick(FPS)
                 
             except Exception as e:
                 print(f"Error in game loop: {e}")
@@ -124,6 +123,9 @@ class Game:
         
         # Update hunter system
         self.hunter_system.update(self.delta_time, self.player)
+        
+        # Update monsters
+        self.monsters.update_all(self.delta_time, self.player)
     
     def render(self):
         """Render the game."""
@@ -141,9 +143,18 @@ class Game:
         if key == glfw.KEY_ESCAPE and action == glfw.PRESS:
             glfw.set_window_should_close(window, True)
         
+        if key == glfw.KEY_F3 and action == glfw.PRESS:
+            self.print_debug_info()
+        
         # Pass to player for movement
         self.player.handle_key_input(key, action)
     
+    def print_debug_info(self):
+        """Print FPS averaged over recent frames and the player position."""
+        frame_time = self.frame_times[self.frame_times > 0].mean() if self.frame_times.any() else 0.0
+        fps = 1.0 / frame_time if frame_time > 0 else 0.0
+        print(f"FPS: {fps:.1f}, Player pos: {self.player.position}")
+    
     def mouse_callback(self, window, xpos, ypos):
         """Handle mouse movement."""
         if self.first_mouse:
@@ -177,5 +188,6 @@ class Game:
     def cleanup(self):
         """Clean up resources."""
         self.renderer.cleanup()
+        self.world.cleanup()
         glfw.terminate()
         print("Game cleanup completed.")
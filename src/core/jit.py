@@ -0,0 +1,16 @@
+"""
+Optional Numba JIT support with a pure Python fallback
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Return the function unchanged when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -5,10 +5,31 @@ Simplified 2.5D version of Solo Leveling Minecraft using only Pygame
 import pygame
 import numpy as np
 import math
-import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from opensimplex import OpenSimplex
 from ..core.config import *
 
+# RGB color per block type, indexed by block id
+BLOCK_COLORS = np.array([
+    (0, 0, 0),          # Air
+    (50, 200, 50),      # Grass
+    (139, 69, 19),      # Dirt
+    (128, 128, 128),    # Stone
+    (101, 67, 33),      # Wood
+    (34, 139, 34),      # Leaves
+    (65, 105, 225),     # Water
+    (238, 203, 173),    # Sand
+    (105, 105, 105),    # Gravel
+    (64, 64, 64),       # Coal ore
+    (184, 134, 11),     # Iron ore
+    (255, 215, 0),      # Gold ore
+    (185, 242, 255),    # Diamond ore
+    (75, 0, 130),       # Shadow stone
+    (138, 43, 226),     # Gate stone
+    (255, 20, 147)      # Mana crystal
+], dtype=np.uint8)
+
 class SimpleGame:
     """Simplified game class using Pygame for 2.5D isometric rendering."""
     
@@ -24,8 +45,36 @@ class SimpleGame:
         # Simple world
         self.world_size = 100
         self.world = np.zeros((self.world_size, 32, self.world_size), dtype=np.uint8)
+        
+        # Level of detail: each level merges 2x2 cells of the previous one and
+        # covers twice the distance, starting lod_distance tiles from the player
+        self.lod_levels = 3
+        self.lod_distance = 24
+        
+        # Terrain is generated per chunk: nearby chunks up front, the rest
+        # streamed in on a worker thread as the camera moves
+        self.noise = OpenSimplex(seed=12345)
+        self.noise_lock = threading.Lock()  # Array noise is a parallel Numba kernel, unsafe to launch concurrently
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.generated_chunks = set()
+        self.pending_chunks = {}
+        self.camera_chunk = None
+        self.initial_chunk_radius = 2
+        self.stream_chunk_radius = 3
+        
         self.generate_simple_world()
         
+        # Pre-rendered solid color tiles, indexed by LOD level and block type
+        self.tile_surfs = []
+        for level in range(self.lod_levels):
+            tile_size = 20 * (1 << level) - 2
+            tiles = []
+            for color in BLOCK_COLORS.tolist():
+                tile = pygame.Surface((tile_size, tile_size)).convert()
+                tile.fill(color)
+                tiles.append(tile)
+            self.tile_surfs.append(tiles)
+        
         # Player
         self.player_x = self.world_size // 2
         self.player_y = 20
@@ -36,40 +85,170 @@ class SimpleGame:
         self.camera_y = 0
         self.zoom = 1.0
         
+        # Key bindings as (key, alternate key, dx, dz) and (key, dx, dy) tables
+        self.move_keys = (
+            (pygame.K_w, pygame.K_UP, 0, -1),
+            (pygame.K_s, pygame.K_DOWN, 0, 1),
+            (pygame.K_a, pygame.K_LEFT, -1, 0),
+            (pygame.K_d, pygame.K_RIGHT, 1, 0)
+        )
+        self.camera_keys = (
+            (pygame.K_i, 0, -5),
+            (pygame.K_k, 0, 5),
+            (pygame.K_j, -5, 0),
+            (pygame.K_l, 5, 0)
+        )
+        
         # Hunter system
         self.hunter_level = 1
         self.hunter_rank = "E"
         self.experience = 0
         self.shadow_soldiers = []
         
+        # UI fonts and rendered text surfaces, reused across frames
+        self.font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 24)
+        self.text_cache = {}
+        self.max_cached_texts = 100
+        
         print("Solo Leveling Minecraft 2.5D initialized!")
     
     def generate_simple_world(self):
         """Generate a simple world with basic terrain."""
-        noise = OpenSimplex(seed=12345)
-        
-        for x in range(self.world_size):
-            for z in range(self.world_size):
-                # Generate height using noise
-                height = int(noise.noise2(x * 0.1, z * 0.1) * 10 + 16)
-                height = max(1, min(30, height))
-                
-                for y in range(height):
-                    if y < height - 3:
-                        self.world[x, y, z] = 3  # Stone
-                    elif y < height - 1:
-                        self.world[x, y, z] = 2  # Dirt
-                    else:
-                        self.world[x, y, z] = 1  # Grass
-        
-        # Add some special Solo Leveling blocks
-        for _ in range(20):
-            x, z = random.randint(5, self.world_size-5), random.randint(5, self.world_size-5)
-            y = random.randint(5, 15)
-            self.world[x, y, z] = 13  # Shadow stone
+        # Roll the special Solo Leveling blocks up front so chunks can place them
+        xs = np.random.randint(5, self.world_size - 4, 20)
+        zs = np.random.randint(5, self.world_size - 4, 20)
+        ys = np.random.randint(5, 16, 20)
+        self.shadow_stones = list(zip(xs.tolist(), ys.tolist(), zs.tolist()))
+        
+        # Generate the chunks around the world center (where the player starts)
+        center = self.world_size // 2 // CHUNK_SIZE
+        for coords in self.get_chunks_around(center, center, self.initial_chunk_radius):
+            self.generate_chunk(*coords)
+            self.generated_chunks.add(coords)
         
+        self.update_heightmap()
         print("Simple world generated!")
     
+    def get_chunks_around(self, chunk_x, chunk_z, radius):
+        """Get coordinates of the chunks within radius that lie inside the world."""
+        num_chunks = -(-self.world_size // CHUNK_SIZE)
+        return [
+            (cx, cz)
+            for cx in range(max(0, chunk_x - radius), min(num_chunks, chunk_x + radius + 1))
+            for cz in range(max(0, chunk_z - radius), min(num_chunks, chunk_z + radius + 1))
+        ]
+    
+    def generate_chunk(self, chunk_x, chunk_z):
+        """Generate the terrain of one CHUNK_SIZE x CHUNK_SIZE chunk."""
+        x0, z0 = chunk_x * CHUNK_SIZE, chunk_z * CHUNK_SIZE
+        x1, z1 = min(x0 + CHUNK_SIZE, self.world_size), min(z0 + CHUNK_SIZE, self.world_size)
+        
+        # Generate the chunk heightmap in one batched noise call
+        with self.noise_lock:
+            heights = self.noise.noise2array(np.arange(x0, x1) * 0.1, np.arange(z0, z1) * 0.1)
+        heights = heights.T * 10 + 16
+        heights = np.clip(heights.astype(np.int32), 1, 30)[:, None, :]
+        
+        # Fill stone/dirt/grass layers by broadcasting y against the heightmap
+        blocks = np.zeros((x1 - x0, self.world.shape[1], z1 - z0), dtype=np.uint8)
+        y = np.arange(self.world.shape[1])[None, :, None]
+        blocks[y < heights - 3] = 3  # Stone
+        blocks[(y >= heights - 3) & (y < heights - 1)] = 2  # Dirt
+        blocks[y == heights - 1] = 1  # Grass
+        
+        for x, y, z in self.shadow_stones:
+            if x0 <= x < x1 and z0 <= z < z1:
+                blocks[x - x0, y, z - z0] = 13  # Shadow stone
+        
+        self.world[x0:x1, :, z0:z1] = blocks
+    
+    def request_chunks(self, chunk_x, chunk_z):
+        """Queue generation of missing chunks around a chunk on the worker thread."""
+        for coords in self.get_chunks_around(chunk_x, chunk_z, self.stream_chunk_radius):
+            if coords not in self.generated_chunks and coords not in self.pending_chunks:
+                self.pending_chunks[coords] = self.executor.submit(self.generate_chunk, *coords)
+    
+    def apply_finished_chunks(self):
+        """Refresh the surface maps for chunks the worker thread has finished."""
+        finished = [coords for coords, future in self.pending_chunks.items() if future.done()]
+        for coords in finished:
+            self.pending_chunks.pop(coords).result()
+            self.generated_chunks.add(coords)
+            
+            x0, z0 = coords[0] * CHUNK_SIZE, coords[1] * CHUNK_SIZE
+            self.update_heightmap_region(x0, x0 + CHUNK_SIZE, z0, z0 + CHUNK_SIZE)
+        
+        if finished:
+            self.update_lod()
+    
+    def update_heightmap(self):
+        """Recompute the surface height and surface block of every column."""
+        # Rendering only reads these 2D maps, never the 3D world array
+        self.heightmap = np.zeros((self.world_size, self.world_size), dtype=np.uint8)
+        self.surface_blocks = np.zeros((self.world_size, self.world_size), dtype=np.uint8)
+        self.update_heightmap_region(0, self.world_size, 0, self.world_size)
+        self.update_lod()
+    
+    def update_heightmap_region(self, x0, x1, z0, z1):
+        """Recompute the surface height and surface block of columns in a region."""
+        world = self.world[x0:x1, :, z0:z1]
+        solid = world != 0
+        top = world.shape[1] - 1 - np.argmax(solid[:, ::-1, :], axis=1)
+        heights = np.where(solid.any(axis=1), top, 0).astype(np.uint8)
+        self.heightmap[x0:x1, z0:z1] = heights
+        self.surface_blocks[x0:x1, z0:z1] = np.take_along_axis(world, heights[:, None, :], axis=1)[:, 0, :]
+    
+    def update_lod(self):
+        """Rebuild the coarser heightmap levels used for distant tiles."""
+        self.lod_heightmaps = [self.heightmap]
+        self.lod_surface_blocks = [self.surface_blocks]
+        for _ in range(1, self.lod_levels):
+            heights, blocks = self.reduce_lod(self.lod_heightmaps[-1], self.lod_surface_blocks[-1])
+            self.lod_heightmaps.append(heights)
+            self.lod_surface_blocks.append(blocks)
+    
+    @staticmethod
+    def reduce_lod(heights, blocks):
+        """Merge each 2x2 cell into its tallest column."""
+        pad = ((0, heights.shape[0] % 2), (0, heights.shape[1] % 2))
+        # Padding is never picked over a real column: ties go to the first cell
+        heights = np.pad(heights, pad)
+        blocks = np.pad(blocks, pad)
+        
+        w, d = heights.shape[0] // 2, heights.shape[1] // 2
+        heights = heights.reshape(w, 2, d, 2).transpose(0, 2, 1, 3).reshape(w, d, 4)
+        blocks = blocks.reshape(w, 2, d, 2).transpose(0, 2, 1, 3).reshape(w, d, 4)
+        
+        tallest = np.argmax(heights, axis=2)[..., None]
+        return (np.take_along_axis(heights, tallest, axis=2)[..., 0],
+                np.take_along_axis(blocks, tallest, axis=2)[..., 0])
+    
+    def set_block(self, x, y, z, block_type):
+        """Set a block and refresh the surface of its column."""
+        self.world[x, y, z] = block_type
+        surface_y = self.heightmap[x, z]
+        
+        if block_type != 0 and y >= surface_y:
+            # Placed on or above the surface
+            surface_y = y
+        elif block_type == 0 and y == surface_y:
+            # Surface block removed, rescan only this column
+            column = np.flatnonzero(self.world[x, :y, z])
+            surface_y = column[-1] if len(column) else 0
+        
+        self.heightmap[x, z] = surface_y
+        self.surface_blocks[x, z] = self.world[x, surface_y, z]
+        
+        # Refresh the LOD cells containing this column
+        for level in range(1, self.lod_levels):
+            x, z = x >> 1, z >> 1
+            heights = self.lod_heightmaps[level - 1][2 * x:2 * x + 2, 2 * z:2 * z + 2]
+            blocks = self.lod_surface_blocks[level - 1][2 * x:2 * x + 2, 2 * z:2 * z + 2]
+            tallest = np.argmax(heights)
+            self.lod_heightmaps[level][x, z] = heights.flat[tallest]
+            self.lod_surface_blocks[level][x, z] = blocks.flat[tallest]
+    
     def run(self):
         """Main game loop."""
         while self.running:
@@ -78,6 +257,7 @@ class SimpleGame:
             self.render()
             self.clock.tick(FPS)
         
+        self.executor.shutdown(wait=False)
         pygame.quit()
     
     def handle_events(self):
@@ -91,24 +271,20 @@ class SimpleGame:
         
         # Movement
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            self.player_z = max(0, self.player_z - 1)
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            self.player_z = min(self.world_size - 1, self.player_z + 1)
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            self.player_x = max(0, self.player_x - 1)
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.player_x = min(self.world_size - 1, self.player_x + 1)
+        dx = dz = 0
+        for key, alt_key, mx, mz in self.move_keys:
+            if keys[key] or keys[alt_key]:
+                dx += mx
+                dz += mz
+        if dx or dz:
+            self.player_x = min(max(self.player_x + dx, 0), self.world_size - 1)
+            self.player_z = min(max(self.player_z + dz, 0), self.world_size - 1)
         
         # Camera movement
-        if keys[pygame.K_i]:
-            self.camera_y -= 5
-        if keys[pygame.K_k]:
-            self.camera_y += 5
-        if keys[pygame.K_j]:
-            self.camera_x -= 5
-        if keys[pygame.K_l]:
-            self.camera_x += 5
+        for key, cx, cy in self.camera_keys:
+            if keys[key]:
+                self.camera_x += cx
+                self.camera_y += cy
     
     def update(self):
         """Update game state."""
@@ -118,30 +294,39 @@ class SimpleGame:
         
         self.camera_x += (target_camera_x - self.camera_x) * 0.1
         self.camera_y += (target_camera_y - self.camera_y) * 0.1
+        
+        # Stream in terrain when the screen center enters a new chunk
+        camera_chunk = (int((WINDOW_WIDTH / 2 - self.camera_x) / 20) // CHUNK_SIZE,
+                        int((WINDOW_HEIGHT / 2 - self.camera_y) / 20) // CHUNK_SIZE)
+        if camera_chunk != self.camera_chunk:
+            self.camera_chunk = camera_chunk
+            self.request_chunks(*camera_chunk)
+        self.apply_finished_chunks()
     
     def render(self):
         """Render the game."""
         self.screen.fill((135, 206, 250))  # Sky blue background
         
         # Render world (simple top-down for now)
-        for x in range(max(0, self.player_x - 20), min(self.world_size, self.player_x + 20)):
-            for z in range(max(0, self.player_z - 20), min(self.world_size, self.player_z + 20)):
-                # Find surface block
-                surface_y = 0
-                for y in range(31, -1, -1):
-                    if self.world[x, y, z] != 0:
-                        surface_y = y
-                        break
-                
-                block_type = self.world[x, surface_y, z]
-                color = self.get_block_color(block_type)
-                
-                # Calculate screen position
-                screen_x = int(self.camera_x + x * 20)
-                screen_y = int(self.camera_y + z * 20 - surface_y * 2)
-                
-                if 0 <= screen_x < WINDOW_WIDTH and 0 <= screen_y < WINDOW_HEIGHT:
-                    pygame.draw.rect(self.screen, color, (screen_x, screen_y, 18, 18))
+        window = self.get_visible_window()
+        
+        # Area covered by each LOD level, aligned so the next level's cells tile around it
+        boxes = []
+        for level in range(self.lod_levels - 1):
+            align = 2 << level
+            radius = self.lod_distance << level
+            boxes.append(((self.player_x - radius) // align * align,
+                          -(-(self.player_x + radius) // align) * align,
+                          (self.player_z - radius) // align * align,
+                          -(-(self.player_z + radius) // align) * align))
+        boxes.append((0, self.world_size, 0, self.world_size))
+        
+        # Coarse levels first so the detailed area near the player is drawn on top
+        blit_list = []
+        for level in range(self.lod_levels - 1, -1, -1):
+            inner = boxes[level - 1] if level > 0 else None
+            blit_list.extend(self.get_lod_tiles(level, window, boxes[level], inner))
+        self.screen.blits(blit_list, doreturn=False)
         
         # Render player
         player_screen_x = int(self.camera_x + self.player_x * 20)
@@ -153,41 +338,83 @@ class SimpleGame:
         
         pygame.display.flip()
     
+    def get_visible_window(self):
+        """Get the (x0, x1, z0, z1) tile range that can land on screen."""
+        # Invert the screen transform, allowing for tile size and height offset
+        max_lift = 2 * (self.world.shape[1] - 1)
+        x0 = math.floor((-18 - self.camera_x) / 20)
+        x1 = math.floor((WINDOW_WIDTH - self.camera_x) / 20) + 1
+        z0 = math.floor((-18 - self.camera_y) / 20)
+        z1 = math.floor((WINDOW_HEIGHT + max_lift - self.camera_y) / 20) + 1
+        return (max(0, x0), min(self.world_size, x1),
+                max(0, z0), min(self.world_size, z1))
+    
+    def get_lod_tiles(self, level, window, box, inner):
+        """Get (tile, position) blits for one LOD level, excluding the finer inner box."""
+        size = 1 << level
+        heights = self.lod_heightmaps[level]
+        
+        # Cells of this level inside both its box and the view window
+        x0, x1 = max(box[0], window[0]) >> level, -(-min(box[1], window[1]) // size)
+        z0, z1 = max(box[2], window[2]) >> level, -(-min(box[3], window[3]) // size)
+        x1, z1 = min(x1, heights.shape[0]), min(z1, heights.shape[1])
+        if x0 >= x1 or z0 >= z1:
+            return []
+        
+        xs, zs = np.meshgrid(np.arange(x0, x1), np.arange(z0, z1), indexing='ij')
+        surface_y = heights[x0:x1, z0:z1]
+        
+        # Calculate screen positions for all cells at once
+        step = 20 * size
+        tile_size = step - 2
+        screen_x = (self.camera_x + xs * step).astype(np.int32)
+        screen_y = (self.camera_y + zs * step - surface_y * 2).astype(np.int32)
+        visible = ((screen_x > -tile_size) & (screen_x < WINDOW_WIDTH) &
+                   (screen_y > -tile_size) & (screen_y < WINDOW_HEIGHT))
+        
+        if inner is not None:
+            ix0, ix1, iz0, iz1 = (v >> level for v in inner)
+            visible &= ~((xs >= ix0) & (xs < ix1) & (zs >= iz0) & (zs < iz1))
+        
+        tiles = self.tile_surfs[level]
+        return [
+            (tiles[block_type], (sx, sy))
+            for block_type, sx, sy in zip(
+                self.lod_surface_blocks[level][x0:x1, z0:z1][visible].tolist(),
+                screen_x[visible].tolist(),
+                screen_y[visible].tolist()
+            )
+        ]
+    
     def get_block_color(self, block_type):
         """Get color for block type."""
-        colors = {
-            0: (0, 0, 0),           # Air
-            1: (50, 200, 50),       # Grass
-            2: (139, 69, 19),       # Dirt
-            3: (128, 128, 128),     # Stone
-            4: (101, 67, 33),       # Wood
-            5: (34, 139, 34),       # Leaves
-            6: (65, 105, 225),      # Water
-            7: (238, 203, 173),     # Sand
-            8: (105, 105, 105),     # Gravel
-            9: (64, 64, 64),        # Coal ore
-            10: (184, 134, 11),     # Iron ore
-            11: (255, 215, 0),      # Gold ore
-            12: (185, 242, 255),    # Diamond ore
-            13: (75, 0, 130),       # Shadow stone
-            14: (138, 43, 226),     # Gate stone
-            15: (255, 20, 147)      # Mana crystal
-        }
-        return colors.get(block_type, (255, 255, 255))
+        if 0 <= block_type < len(BLOCK_COLORS):
+            return tuple(BLOCK_COLORS[block_type].tolist())
+        return (255, 255, 255)
+    
+    def render_text(self, font, text, color=(255, 255, 255)):
+        """Render text, reusing the surface if it was rendered before."""
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            if len(self.text_cache) >= self.max_cached_texts:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self.text_cache[next(iter(self.text_cache))]
+            self.text_cache[key] = surface
+        return surface
     
     def render_ui(self):
         """Render UI elements."""
-        font = pygame.font.Font(None, 36)
-        
         # Hunter info
-        hunter_text = font.render(f"Hunter Rank: {self.hunter_rank} | Level: {self.hunter_level}", True, (255, 255, 255))
+        hunter_text = self.render_text(self.font, f"Hunter Rank: {self.hunter_rank} | Level: {self.hunter_level}")
         self.screen.blit(hunter_text, (10, 10))
         
-        exp_text = font.render(f"EXP: {self.experience}", True, (255, 255, 255))
+        exp_text = self.render_text(self.font, f"EXP: {self.experience}")
         self.screen.blit(exp_text, (10, 50))
         
         # Position
-        pos_text = font.render(f"Position: ({self.player_x}, {self.player_y}, {self.player_z})", True, (255, 255, 255))
+        pos_text = self.render_text(self.font, f"Position: ({self.player_x}, {self.player_y}, {self.player_z})")
         self.screen.blit(pos_text, (10, 90))
         
         # Controls
@@ -197,11 +424,10 @@ class SimpleGame:
             "ESC: Quit"
         ]
         
-        small_font = pygame.font.Font(None, 24)
         for i, control in enumerate(controls):
-            text = small_font.render(control, True, (255, 255, 255))
+            text = self.render_text(self.small_font, control)
             self.screen.blit(text, (10, WINDOW_HEIGHT - 80 + i * 25))
         
         # Solo Leveling features
-        shadow_text = small_font.render(f"Shadow Soldiers: {len(self.shadow_soldiers)}", True, (255, 255, 255))
+        shadow_text = self.render_text(self.small_font, f"Shadow Soldiers: {len(self.shadow_soldiers)}")
         self.screen.blit(shadow_text, (WINDOW_WIDTH - 200, 10))
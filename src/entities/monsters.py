@@ -2,8 +2,68 @@
 Entity system for mobs and creatures
 """
 
+import math
+import random
 import numpy as np
 from ..core.config import *
+from ..core.jit import NUMBA_AVAILABLE, njit
+
+# Base stats per monster type (scaled by level), indexed by MONSTER_TYPE_INDEX
+MONSTER_TYPE_INDEX = {"ant": 0, "wolf": 1, "orc": 2, "knight": 3, "dragon": 4}
+MONSTER_STATS = np.array([
+    (80, 15, 1.5),      # Ant
+    (120, 25, 2.0),     # Wolf
+    (200, 35, 1.2),     # Orc
+    (300, 50, 1.0),     # Knight
+    (1000, 100, 0.8)    # Dragon
+], dtype=[("health", np.int32), ("attack", np.int32), ("speed", np.float64)])
+
+# Serial on purpose: a parallel kernel would share Numba's threading layer with the
+# chunk generation workers, and the default workqueue layer aborts on concurrent launches
+@njit(cache=True, fastmath=True)
+def step_monsters(positions, velocities, cooldown, move_speed, detection_range,
+                  is_alive, has_target, attacking, player_x, player_y, player_z, delta_time):
+    """Advance physics and chase AI for all monsters in one compiled loop."""
+    for i in range(positions.shape[0]):
+        attacking[i] = False
+        has_target[i] = False
+        if not is_alive[i]:
+            continue
+        
+        # Apply gravity and update position
+        velocities[i, 1] += GRAVITY * delta_time
+        positions[i, 0] += velocities[i, 0] * delta_time
+        positions[i, 1] += velocities[i, 1] * delta_time
+        positions[i, 2] += velocities[i, 2] * delta_time
+        
+        # Simple ground collision
+        if positions[i, 1] < 65:
+            positions[i, 1] = 65
+            velocities[i, 1] = 0
+        
+        if cooldown[i] > 0:
+            cooldown[i] -= delta_time
+        
+        dx = player_x - positions[i, 0]
+        dy = player_y - positions[i, 1]
+        dz = player_z - positions[i, 2]
+        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+        
+        if distance <= detection_range[i]:
+            has_target[i] = True
+            if distance > 2.0:
+                horizontal = math.sqrt(dx * dx + dz * dz)
+                if horizontal > 0:
+                    velocities[i, 0] = dx / horizontal * move_speed[i]
+                    velocities[i, 2] = dz / horizontal * move_speed[i]
+            else:
+                velocities[i, 0] = 0
+                velocities[i, 2] = 0
+                attacking[i] = cooldown[i] <= 0
+        else:
+            velocities[i, 0] = 0
+            velocities[i, 2] = 0
+
 
 class Entity:
     """Base entity class."""
@@ -12,6 +72,7 @@ class Entity:
         """Initialize entity."""
         self.position = np.array([x, y, z], dtype=np.float32)
         self.velocity = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+        self.step = np.zeros(3, dtype=np.float32)  # Scratch for velocity * delta_time
         self.entity_type = entity_type
         self.health = 100
         self.max_health = 100
@@ -26,8 +87,9 @@ class Entity:
         # Apply gravity
         self.velocity[1] += GRAVITY * delta_time
         
-        # Update position
-        self.position += self.velocity * delta_time
+        # Update position without allocating a temporary
+        np.multiply(self.velocity, delta_time, out=self.step)
+        self.position += self.step
         
         # Simple ground collision
         if self.position[1] < 65:  # Ground level
@@ -59,20 +121,12 @@ class Monster(Entity):
         self.can_be_extracted = True  # Can become shadow soldier
         
         # Monster-specific stats
-        monster_stats = {
-            "ant": {"health": 80, "attack": 15, "speed": 1.5},
-            "wolf": {"health": 120, "attack": 25, "speed": 2.0},
-            "orc": {"health": 200, "attack": 35, "speed": 1.2},
-            "knight": {"health": 300, "attack": 50, "speed": 1.0},
-            "dragon": {"health": 1000, "attack": 100, "speed": 0.8}
-        }
-        
-        if monster_type in monster_stats:
-            stats = monster_stats[monster_type]
-            self.max_health = stats["health"] * level
+        if monster_type in MONSTER_TYPE_INDEX:
+            stats = MONSTER_STATS[MONSTER_TYPE_INDEX[monster_type]]
+            self.max_health = int(stats["health"]) * level
             self.health = self.max_health
-            self.attack_power = stats["attack"] * level
-            self.move_speed = stats["speed"]
+            self.attack_power = int(stats["attack"]) * level
+            self.move_speed = float(stats["speed"])
         
         # AI state
         self.target = None
@@ -120,7 +174,7 @@ class Monster(Entity):
     def attack_player(self, player):
         """Attack the player."""
         if self.attack_cooldown <= 0:
-            damage = np.random.randint(self.attack_power // 2, self.attack_power + 1)
+            damage = random.randint(self.attack_power // 2, self.attack_power)
             print(f"{self.entity_type} attacks for {damage} damage!")
             # player.take_damage(damage)  # Implement player damage system
             self.attack_cooldown = 2.0  # 2 second cooldown
@@ -166,7 +220,7 @@ class DungeonBoss(Monster):
     def use_special_ability(self):
         """Use a random special ability."""
         if self.special_abilities:
-            ability = np.random.choice(self.special_abilities)
+            ability = random.choice(self.special_abilities)
             print(f"{self.entity_type} uses {ability}!")
             
             # Implement ability effects here
@@ -181,3 +235,147 @@ class DungeonBoss(Monster):
                 pass
             
             self.ability_cooldown = 10.0  # 10 second cooldown
+
+
+class MonsterPool:
+    """Monsters stored as parallel arrays and updated in one batched pass."""
+    
+    def __init__(self, capacity=MAX_MONSTERS):
+        """Initialize the monster pool."""
+        self.capacity = capacity
+        self.count = 0
+        self.monster_types = []
+        
+        # One row per monster
+        self.positions = np.zeros((capacity, 3), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 3), dtype=np.float32)
+        self.health = np.zeros(capacity, dtype=np.int32)
+        self.max_health = np.zeros(capacity, dtype=np.int32)
+        self.attack_power = np.zeros(capacity, dtype=np.int32)
+        self.experience_reward = np.zeros(capacity, dtype=np.int32)
+        self.level = np.zeros(capacity, dtype=np.int32)
+        self.move_speed = np.zeros(capacity, dtype=np.float32)
+        self.attack_cooldown = np.zeros(capacity, dtype=np.float32)
+        self.detection_range = np.zeros(capacity, dtype=np.float32)
+        self.is_alive = np.zeros(capacity, dtype=bool)
+        self.has_target = np.zeros(capacity, dtype=bool)
+        self.attacking = np.zeros(capacity, dtype=bool)
+    
+    def spawn(self, x, y, z, monster_type, level=1):
+        """Add a monster to the pool and return its index."""
+        indices = self.spawn_wave([(x, y, z)], monster_type, level)
+        return indices[0] if indices else None
+    
+    def spawn_wave(self, positions, monster_type, level=1):
+        """Add monsters of one type at the given positions and return their indices."""
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        n = min(len(positions), self.capacity - self.count)
+        if n < len(positions):
+            print("Monster pool is full!")
+        
+        i, j = self.count, self.count + n
+        self.count = j
+        self.monster_types.extend([monster_type] * n)
+        
+        if monster_type in MONSTER_TYPE_INDEX:
+            stats = MONSTER_STATS[MONSTER_TYPE_INDEX[monster_type]]
+            health, attack_power, move_speed = stats["health"] * level, stats["attack"] * level, stats["speed"]
+        else:
+            # Other types keep the Entity and Monster defaults (health does not scale with level)
+            health, attack_power, move_speed = 100, 20 * level, 1.0
+        
+        # Fill each attribute with one slice assignment
+        self.positions[i:j] = positions[:n]
+        self.velocities[i:j] = 0.0
+        self.max_health[i:j] = health
+        self.health[i:j] = health
+        self.attack_power[i:j] = attack_power
+        self.experience_reward[i:j] = 50 * level
+        self.level[i:j] = level
+        self.move_speed[i:j] = move_speed
+        self.attack_cooldown[i:j] = 0.0
+        self.detection_range[i:j] = 10.0
+        self.is_alive[i:j] = True
+        self.has_target[i:j] = False
+        return range(i, j)
+    
+    def update_all(self, delta_time, player):
+        """Update physics and chase AI for every monster at once."""
+        n = self.count
+        if n == 0:
+            return
+        
+        if NUMBA_AVAILABLE:
+            attackers = self.step_jit(n, delta_time, player.position)
+        else:
+            attackers = self.step_numpy(n, delta_time, player.position)
+        
+        for i in attackers:
+            self.attack_player(i, player)
+    
+    def step_jit(self, n, delta_time, player_position):
+        """Run the compiled monster step and return the indices that attack."""
+        step_monsters(
+            self.positions[:n], self.velocities[:n], self.attack_cooldown[:n],
+            self.move_speed[:n], self.detection_range[:n], self.is_alive[:n],
+            self.has_target[:n], self.attacking[:n],
+            float(player_position[0]), float(player_position[1]), float(player_position[2]),
+            delta_time
+        )
+        return np.flatnonzero(self.attacking[:n])
+    
+    def step_numpy(self, n, delta_time, player_position):
+        """Run the vectorized monster step and return the indices that attack."""
+        alive = self.is_alive[:n]
+        positions = self.positions[:n]
+        velocities = self.velocities[:n]
+        cooldown = self.attack_cooldown[:n]
+        
+        # Apply gravity and update position
+        velocities[alive, 1] += GRAVITY * delta_time
+        positions[alive] += velocities[alive] * delta_time
+        
+        # Simple ground collision
+        grounded = alive & (positions[:, 1] < 65)
+        positions[grounded, 1] = 65
+        velocities[grounded, 1] = 0
+        
+        # Update attack cooldowns
+        np.subtract(cooldown, delta_time, out=cooldown, where=alive & (cooldown > 0))
+        
+        # Simple AI: chase player if in range
+        delta = np.asarray(player_position, dtype=np.float32) - positions
+        distance = np.sqrt((delta * delta).sum(axis=1))
+        in_range = alive & (distance <= self.detection_range[:n])
+        chasing = in_range & (distance > 2.0)
+        self.has_target[:n] = in_range
+        
+        # Move towards player horizontally
+        horizontal = np.hypot(delta[:, 0], delta[:, 2])
+        moving = chasing & (horizontal > 0)
+        scale = self.move_speed[:n][moving] / horizontal[moving]
+        velocities[moving, 0] = delta[moving, 0] * scale
+        velocities[moving, 2] = delta[moving, 2] * scale
+        
+        # Stop when out of range or close enough to attack
+        stopped = alive & ~chasing
+        velocities[stopped, 0] = 0
+        velocities[stopped, 2] = 0
+        
+        return np.flatnonzero(in_range & ~chasing & (cooldown <= 0))
+    
+    def attack_player(self, i, player):
+        """Attack the player with the monster at index i."""
+        if self.attack_cooldown[i] <= 0:
+            attack_power = int(self.attack_power[i])
+            damage = random.randint(attack_power // 2, attack_power)
+            print(f"{self.monster_types[i]} attacks for {damage} damage!")
+            # player.take_damage(damage)  # Implement player damage system
+            self.attack_cooldown[i] = 2.0  # 2 second cooldown
+    
+    def take_damage(self, i, damage):
+        """Damage the monster at index i."""
+        self.health[i] = max(0, self.health[i] - damage)
+        if self.health[i] == 0 and self.is_alive[i]:
+            self.is_alive[i] = False
+            print(f"{self.monster_types[i]} defeated!")
@@ -9,16 +9,26 @@ from ..core.config import *
 class Camera:
     """First-person camera for 3D world navigation."""
     
+    DEG_TO_RAD = math.pi / 180.0
+    
     def __init__(self, position=None):
         """Initialize the camera."""
         if position is None:
             self.position = np.array([8.0, 67.0, 8.0], dtype=np.float32)
         else:
             self.position = position.copy() if isinstance(position, np.ndarray) else np.array(position, dtype=np.float32)
-        self.front = np.array([0.0, 0.0, -1.0], dtype=np.float32)
-        self.up = np.array([0.0, 1.0, 0.0], dtype=np.float32)
-        self.right = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-        self.world_up = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+        
+        # Basis vectors share one block; the attributes are row views into it
+        self.vectors = np.array([
+            [0.0, 0.0, -1.0],  # Front
+            [1.0, 0.0, 0.0],   # Right
+            [0.0, 1.0, 0.0],   # Up
+            [0.0, 1.0, 0.0]    # World up
+        ], dtype=np.float32)
+        self.front = self.vectors[0]
+        self.right = self.vectors[1]
+        self.up = self.vectors[2]
+        self.world_up = self.vectors[3]
         
         # Euler angles
         self.yaw = -90.0  # Looking towards negative Z
@@ -29,42 +39,59 @@ class Camera:
         self.mouse_sensitivity = 0.1
         self.zoom = 45.0
         
-        # Projection matrix
-        self.projection_matrix = self.get_projection_matrix(WINDOW_WIDTH, WINDOW_HEIGHT)
+        # Projection matrix (filled in place on resize, bumping the version)
+        self.projection_matrix = np.zeros((4, 4), dtype=np.float32)
+        self.projection_version = 0
+        self.update_projection(WINDOW_WIDTH, WINDOW_HEIGHT)
+        
+        # View matrix (filled in place every frame)
+        self.view_matrix = np.zeros((4, 4), dtype=np.float32)
+        self.view_matrix[3, 3] = 1.0
         
         self.update_camera_vectors()
         print(f"Camera initialized at {self.position}, looking {self.front}")
     
     def get_view_matrix(self):
         """Get the view matrix for rendering."""
-        return self.look_at(self.position, self.position + self.front, self.up)
+        # Look-at matrix towards position + front, built from the cached basis vectors
+        px, py, pz = float(self.position[0]), float(self.position[1]), float(self.position[2])
+        (fx, fy, fz), (rx, ry, rz), (ux, uy, uz), _ = self.vectors.tolist()
+        
+        view = self.view_matrix
+        view[0, 0], view[1, 0], view[2, 0] = rx, ry, rz
+        view[0, 1], view[1, 1], view[2, 1] = ux, uy, uz
+        view[0, 2], view[1, 2], view[2, 2] = -fx, -fy, -fz
+        view[3, 0] = -(rx * px + ry * py + rz * pz)
+        view[3, 1] = -(ux * px + uy * py + uz * pz)
+        view[3, 2] = fx * px + fy * py + fz * pz
+        return view
     
-    def get_projection_matrix(self, width, height):
-        """Get the projection matrix."""
+    def fill_projection_matrix(self, projection, width, height):
+        """Write a perspective projection into an existing 4x4 matrix."""
         aspect_ratio = width / height
-        fov = math.radians(self.zoom)
+        fov = self.zoom * self.DEG_TO_RAD
         near = 0.1
         far = 1000.0
         
-        # Create perspective projection matrix
+        # Only the non-zero entries are written, transposed like the view matrix
+        # so both upload to column-major GLSL uniforms as-is
         f = 1.0 / math.tan(fov / 2.0)
-        projection = np.array([
-            [f / aspect_ratio, 0, 0, 0],
-            [0, f, 0, 0],
-            [0, 0, (far + near) / (near - far), (2 * far * near) / (near - far)],
-            [0, 0, -1, 0]
-        ], dtype=np.float32)
-        
-        return projection
+        projection[0, 0] = f / aspect_ratio
+        projection[1, 1] = f
+        projection[2, 2] = (far + near) / (near - far)
+        projection[3, 2] = (2 * far * near) / (near - far)
+        projection[2, 3] = -1
     
     def update_projection(self, width, height):
         """Update projection matrix when window is resized."""
-        self.projection_matrix = self.get_projection_matrix(width, height)
+        self.fill_projection_matrix(self.projection_matrix, width, height)
+        self.projection_version += 1
     
     def process_mouse_movement(self, xoffset, yoffset, constrain_pitch=True):
         """Process mouse movement for camera rotation."""
         xoffset *= self.mouse_sensitivity
         yoffset *= self.mouse_sensitivity
+        old_yaw, old_pitch = self.yaw, self.pitch
         
         self.yaw += xoffset
         self.pitch += yoffset
@@ -76,41 +103,35 @@ class Camera:
             if self.pitch < -89.0:
                 self.pitch = -89.0
         
-        self.update_camera_vectors()
+        # Skip the trig when nothing changed (e.g. pitch pinned at the limit)
+        if self.yaw != old_yaw or self.pitch != old_pitch:
+            self.update_camera_vectors()
     
     def update_camera_vectors(self):
-        """Calculate front vector from euler angles."""
-        front = np.array([
-            math.cos(math.radians(self.yaw)) * math.cos(math.radians(self.pitch)),
-            math.sin(math.radians(self.pitch)),
-            math.sin(math.radians(self.yaw)) * math.cos(math.radians(self.pitch))
-        ], dtype=np.float32)
+        """Calculate front, right and up vectors from euler angles."""
+        yaw = self.yaw * self.DEG_TO_RAD
+        pitch = self.pitch * self.DEG_TO_RAD
+        cos_pitch = math.cos(pitch)
         
-        self.front = self.normalize(front)
-        self.right = self.normalize(np.cross(self.front, self.world_up))
-        self.up = self.normalize(np.cross(self.right, self.front))
+        # Front is unit length by construction
+        fx = math.cos(yaw) * cos_pitch
+        fy = math.sin(pitch)
+        fz = math.sin(yaw) * cos_pitch
+        
+        # Right = normalize(front x world_up)
+        wx, wy, wz = self.world_up.tolist()
+        rx, ry, rz = Camera.normalize_scalars(fy * wz - fz * wy, fz * wx - fx * wz, fx * wy - fy * wx)
+        
+        # Up = right x front (unit length since right is perpendicular to front)
+        ux, uy, uz = ry * fz - rz * fy, rz * fx - rx * fz, rx * fy - ry * fx
+        
+        # Write into the existing block instead of allocating new arrays
+        self.vectors[:3] = ((fx, fy, fz), (rx, ry, rz), (ux, uy, uz))
     
     @staticmethod
-    def normalize(vector):
-        """Normalize a vector."""
-        norm = np.linalg.norm(vector)
+    def normalize_scalars(x, y, z):
+        """Normalize a vector given as three scalars."""
+        norm = math.sqrt(x * x + y * y + z * z)
         if norm == 0:
-            return vector
-        return vector / norm
-    
-    @staticmethod
-    def look_at(position, target, up):
-        """Create a look-at matrix."""
-        direction = Camera.normalize(position - target)
-        right = Camera.normalize(np.cross(Camera.normalize(up), direction))
-        up_vec = np.cross(direction, right)
-        
-        # Create look-at matrix
-        look_at_matrix = np.array([
-            [right[0], up_vec[0], direction[0], 0],
-            [right[1], up_vec[1], direction[1], 0],
-            [right[2], up_vec[2], direction[2], 0],
-            [-np.dot(right, position), -np.dot(up_vec, position), -np.dot(direction, position), 1]
-        ], dtype=np.float32)
-        
-        return look_at_matrix
+            return x, y, z
+        return x / norm, y / norm, z / norm
@@ -2,9 +2,154 @@
 Basic OpenGL renderer for the voxel world
 """
 
+import bisect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import moderngl
 import numpy as np
 from ..core.config import *
+from ..core.jit import NUMBA_AVAILABLE, njit
+
+# Face templates in top, bottom, right, left, front, back order
+FACE_DIRECTIONS = ((0, 1, 0), (0, -1, 0), (1, 0, 0), (-1, 0, 0), (0, 0, 1), (0, 0, -1))
+FACE_NORMALS = np.array([direction + (0,) for direction in FACE_DIRECTIONS], dtype=np.int8)  # Padded to 4 bytes
+FACE_OFFSETS = np.array([
+    [[0, 1, 0], [1, 1, 0], [1, 1, 1], [0, 1, 1]],  # Top
+    [[0, 0, 1], [1, 0, 1], [1, 0, 0], [0, 0, 0]],  # Bottom
+    [[1, 0, 0], [1, 0, 1], [1, 1, 1], [1, 1, 0]],  # Right
+    [[0, 0, 1], [0, 0, 0], [0, 1, 0], [0, 1, 1]],  # Left
+    [[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]],  # Front
+    [[1, 0, 0], [0, 0, 0], [0, 1, 0], [1, 1, 0]]   # Back
+], dtype=np.int16)
+QUAD_INDICES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+MAX_CHUNK_FACES = CHUNK_SIZE * WORLD_HEIGHT * CHUNK_SIZE * 6
+
+# Plane axes per face: the normal axis, then the two in-plane axes swept by the greedy mesher
+FACE_AXES = ((1, 0, 2), (1, 0, 2), (0, 1, 2), (0, 1, 2), (2, 0, 1), (2, 0, 1))
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def mesh_chunk(blocks, palette, out_positions, out_colors, out_normals, out_indices):
+    """Greedy mesh the visible faces of a chunk in local coordinates and return the vertex count."""
+    shape = (blocks.shape[0], blocks.shape[2], blocks.shape[1])  # x, y, z extents of the [x, z, y] blocks
+    cell = np.zeros(3, dtype=np.int64)
+    size = np.ones(3, dtype=np.int64)
+    count = 0
+    
+    for face in range(6):
+        dx, dy, dz = FACE_DIRECTIONS[face]
+        axis, u, v = FACE_AXES[face]
+        mask = np.zeros((shape[u], shape[v]), dtype=np.uint8)
+        
+        for layer in range(shape[axis]):
+            # Mask of exposed faces in this slice, tagged by block type
+            cell[axis] = layer
+            for i in range(shape[u]):
+                cell[u] = i
+                for j in range(shape[v]):
+                    cell[v] = j
+                    x, y, z = cell[0], cell[1], cell[2]
+                    block = blocks[x, z, y]
+                    mask[i, j] = block
+                    if block == 0:  # Air
+                        continue
+                    
+                    # Faces are hidden only by solid, non-water blocks inside the chunk
+                    nx, ny, nz = x + dx, y + dy, z + dz
+                    if 0 <= ny < shape[1] and 0 <= nx < shape[0] and 0 <= nz < shape[2]:
+                        neighbor = blocks[nx, nz, ny]
+                        if neighbor != 0 and neighbor != 6:
+                            mask[i, j] = 0
+            
+            # Sweep the mask into maximal same-type rectangles
+            for i in range(shape[u]):
+                j = 0
+                while j < shape[v]:
+                    block = mask[i, j]
+                    if block == 0:
+                        j += 1
+                        continue
+                    
+                    width = 1
+                    while j + width < shape[v] and mask[i, j + width] == block:
+                        width += 1
+                    
+                    height = 1
+                    while i + height < shape[u]:
+                        row_matches = True
+                        for k in range(j, j + width):
+                            if mask[i + height, k] != block:
+                                row_matches = False
+                                break
+                        if not row_matches:
+                            break
+                        height += 1
+                    
+                    mask[i:i + height, j:j + width] = 0
+                    
+                    # Scale the face template's in-plane edges to the rectangle
+                    cell[u] = i
+                    cell[v] = j
+                    size[u] = height
+                    size[v] = width
+                    for corner in range(4):
+                        vertex = count + corner
+                        for k in range(3):
+                            out_positions[vertex, k] = cell[k] + FACE_OFFSETS[face, corner, k] * size[k]
+                        for channel in range(4):
+                            out_colors[vertex, channel] = palette[block, channel]
+                        for k in range(4):
+                            out_normals[vertex, k] = FACE_NORMALS[face, k]
+                    size[u] = 1
+                    size[v] = 1
+                    
+                    first_index = count // 4 * 6
+                    for k in range(6):
+                        out_indices[first_index + k] = count + QUAD_INDICES[k]
+                    count += 4
+                    j += width
+    return count
+
+# Initial capacity of the shared chunk mesh buffers, doubled when full
+MESH_BUFFER_VERTICES = 1 << 20
+MESH_BUFFER_INDICES = 3 << 19
+
+
+class RangeAllocator:
+    """First-fit allocator for ranges of a buffer, merging neighbors on free."""
+    
+    def __init__(self, capacity):
+        """Initialize with the whole range free."""
+        self.capacity = capacity
+        self.free_ranges = [(0, capacity)]  # Sorted (offset, size)
+    
+    def allocate(self, size):
+        """Return the offset of a free range of the given size, or None if full."""
+        for i, (offset, free_size) in enumerate(self.free_ranges):
+            if free_size >= size:
+                if free_size == size:
+                    del self.free_ranges[i]
+                else:
+                    self.free_ranges[i] = (offset + size, free_size - size)
+                return offset
+        return None
+    
+    def free(self, offset, size):
+        """Return a range, merging it with adjacent free ranges."""
+        i = bisect.bisect(self.free_ranges, (offset, 0))
+        if i < len(self.free_ranges) and offset + size == self.free_ranges[i][0]:
+            size += self.free_ranges.pop(i)[1]
+        if i > 0 and sum(self.free_ranges[i - 1]) == offset:
+            i -= 1
+            offset, previous_size = self.free_ranges.pop(i)
+            size += previous_size
+        self.free_ranges.insert(i, (offset, size))
+    
+    def grow(self, capacity):
+        """Extend the range, freeing the new tail."""
+        self.free(self.capacity, capacity - self.capacity)
+        self.capacity = capacity
+
 
 class Renderer:
     """OpenGL renderer for the game."""
@@ -16,28 +161,45 @@ class Renderer:
         # Create shaders
         self.create_shaders()
         
-        # Block colors (simple colored cubes for now)
-        self.block_colors = {
-            0: (0, 0, 0, 0),        # Air (transparent)
-            1: (0.2, 0.8, 0.2, 1),  # Grass (green)
-            2: (0.5, 0.3, 0.1, 1),  # Dirt (brown)
-            3: (0.5, 0.5, 0.5, 1),  # Stone (gray)
-            4: (0.4, 0.2, 0.1, 1),  # Wood (brown)
-            5: (0.1, 0.6, 0.1, 1),  # Leaves (dark green)
-            6: (0.2, 0.4, 0.8, 0.7), # Water (blue, translucent)
-            7: (0.9, 0.8, 0.6, 1),  # Sand (tan)
-            8: (0.4, 0.4, 0.4, 1),  # Gravel (gray)
-            9: (0.2, 0.2, 0.2, 1),  # Coal ore (dark)
-            10: (0.7, 0.5, 0.3, 1), # Iron ore (rust)
-            11: (0.8, 0.8, 0.2, 1), # Gold ore (yellow)
-            12: (0.4, 0.8, 0.8, 1), # Diamond ore (cyan)
-            13: (0.1, 0.0, 0.3, 1), # Shadow stone (dark purple)
-            14: (0.3, 0.0, 0.6, 1), # Gate stone (purple)
-            15: (0.8, 0.2, 0.8, 1)  # Mana crystal (magenta)
-        }
-        
-        # Chunk meshes cache
+        # Block colors as RGBA bytes, indexed by block id (simple colored cubes for now)
+        self.palette = np.array([
+            [0, 0, 0, 0],           # Air (transparent)
+            [51, 204, 51, 255],     # Grass (green)
+            [128, 76, 26, 255],     # Dirt (brown)
+            [128, 128, 128, 255],   # Stone (gray)
+            [102, 51, 26, 255],     # Wood (brown)
+            [26, 153, 26, 255],     # Leaves (dark green)
+            [51, 102, 204, 178],    # Water (blue, translucent)
+            [230, 204, 153, 255],   # Sand (tan)
+            [102, 102, 102, 255],   # Gravel (gray)
+            [51, 51, 51, 255],      # Coal ore (dark)
+            [178, 128, 76, 255],    # Iron ore (rust)
+            [204, 204, 51, 255],    # Gold ore (yellow)
+            [102, 204, 204, 255],   # Diamond ore (cyan)
+            [26, 0, 76, 255],       # Shadow stone (dark purple)
+            [76, 0, 153, 255],      # Gate stone (purple)
+            [204, 51, 204, 255]     # Mana crystal (magenta)
+        ], dtype=np.uint8)
+        
+        self.frame_count = 0
+        
+        # Last uploaded camera matrices
+        self.view_upload = np.full((4, 4), np.nan, dtype=np.float32)
+        self.projection_key = None
+        
+        # Chunk meshes cache: (first_vertex, vertex_count, first_index, index_count) per chunk
         self.chunk_meshes = {}
+        
+        # All chunk meshes share one buffer per attribute plus one index buffer
+        self.vertex_allocator = RangeAllocator(MESH_BUFFER_VERTICES)
+        self.index_allocator = RangeAllocator(MESH_BUFFER_INDICES)
+        self.create_mesh_buffers(MESH_BUFFER_VERTICES, MESH_BUFFER_INDICES)
+        
+        # Chunks are meshed on worker threads (the compiled kernel releases the GIL);
+        # only the buffer uploads happen on the main thread
+        self.mesh_pool = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1))
+        self.pending_meshes = {}  # Chunk coords -> future of the mesh being built
+        self.mesh_scratch = threading.local()  # Per-thread kernel output buffers, reused across chunks
     
     def create_shaders(self):
         """Create OpenGL shaders."""
@@ -45,10 +207,11 @@ class Renderer:
         vertex_shader = """
         #version 330 core
         
-        layout (location = 0) in vec3 position;
+        layout (location = 0) in ivec3 position;
         layout (location = 1) in vec4 color;
-        layout (location = 2) in vec3 normal;
+        layout (location = 2) in ivec3 normal;
         
+        uniform vec3 chunkOffset;
         uniform mat4 model;
         uniform mat4 view;
         uniform mat4 projection;
@@ -58,10 +221,12 @@ class Renderer:
         out vec3 fragmentPos;
         
         void main() {
-            gl_Position = projection * view * model * vec4(position, 1.0);
+            // Positions are block units local to the chunk
+            vec4 worldPos = model * vec4(vec3(position) + chunkOffset, 1.0);
+            gl_Position = projection * view * worldPos;
             vertexColor = color;
-            vertexNormal = normal;
-            fragmentPos = vec3(model * vec4(position, 1.0));
+            vertexNormal = vec3(normal);
+            fragmentPos = vec3(worldPos);
         }
         """
         
@@ -105,6 +270,10 @@ class Renderer:
         try:
             self.shader_program['lightPos'].value = (0, 100, 0)
             self.shader_program['lightColor'].value = (1.0, 1.0, 1.0)
+            
+            # Chunk positions are placed by chunkOffset, so the model matrix stays identity
+            self.shader_program['model'].write(np.eye(4, dtype=np.float32))
+            self.chunk_offset = self.shader_program['chunkOffset']
         except KeyError as e:
             print(f"Warning: Shader uniform not found: {e}")
     
@@ -116,17 +285,21 @@ class Renderer:
             projection_matrix = player.camera.projection_matrix
             
             # Debug: Print first matrix to verify they're valid
-            if hasattr(self, '_debug_count'):
-                self._debug_count += 1
-            else:
-                self._debug_count = 1
+            self.frame_count += 1
+            if DEBUG and self.frame_count == 1:
                 print(f"View matrix shape: {view_matrix.shape}")
                 print(f"Projection matrix shape: {projection_matrix.shape}")
                 print(f"Camera position: {player.camera.position}")
                 print(f"Camera front: {player.camera.front}")
             
-            self.shader_program['view'].write(view_matrix.astype(np.float32).tobytes())
-            self.shader_program['projection'].write(projection_matrix.astype(np.float32).tobytes())
+            # Matrices are only uploaded when the camera has changed them
+            if not np.array_equal(view_matrix, self.view_upload):
+                np.copyto(self.view_upload, view_matrix)
+                self.shader_program['view'].write(self.view_upload)
+            projection_key = (id(projection_matrix), player.camera.projection_version)
+            if projection_key != self.projection_key:
+                self.projection_key = projection_key
+                self.shader_program['projection'].write(np.ascontiguousarray(projection_matrix, dtype=np.float32))
             if 'viewPos' in self.shader_program:
                 self.shader_program['viewPos'].value = tuple(player.camera.position)
         except KeyError as e:
@@ -136,257 +309,278 @@ class Renderer:
             print(f"Error setting shader uniforms: {e}")
             return
         
-        # Render each loaded chunk with safety limits
+        # Free the buffer ranges of unloaded chunks
+        for key in self.chunk_meshes.keys() - world.loaded_chunks:
+            self.release_chunk_mesh(key)
+        
+        # Skip meshing and drawing chunks outside the view frustum
+        planes = self.extract_frustum_planes(np.dot(view_matrix, projection_matrix))
+        visible_chunks = self.cull_chunks(world.get_loaded_chunks(), planes)
+        
+        # Upload the meshes finished by the workers since last frame as one batch
+        finished = [key for key, future in self.pending_meshes.items() if future.done()]
+        meshes = []
+        for key in finished:
+            future = self.pending_meshes.pop(key)
+            if key not in world.loaded_chunks:
+                continue  # Unloaded (and possibly packed) while meshing; the result is stale
+            try:
+                meshes.append((key, future.result()))
+            except Exception as e:
+                print(f"Error generating mesh for chunk {key}: {e}")
+        try:
+            self.upload_chunk_meshes(meshes)
+        except Exception as e:
+            print(f"Error updating chunk meshes: {e}")
+        
+        # Queue visible dirty chunks, keeping a bounded number of meshes in flight
+        max_pending_meshes = 16  # Limit queued mesh rebuilds to bound memory use
+        if world.dirty_chunks and len(self.pending_meshes) < max_pending_meshes:
+            visible_keys = {(chunk.x, chunk.z) for chunk in visible_chunks}
+            dirty_keys = [key for key in world.dirty_chunks
+                          if key in visible_keys and key not in self.pending_meshes]
+            for key in dirty_keys[:max_pending_meshes - len(self.pending_meshes)]:
+                # Edits made while the mesh is in flight re-dirty the chunk and queue it again
+                world.dirty_chunks.discard(key)
+                self.pending_meshes[key] = self.mesh_pool.submit(self.generate_chunk_mesh, world.chunks[key])
+        
+        # Render each visible chunk
         chunks_rendered = 0
-        max_chunks_per_frame = 16  # Limit chunks per frame to prevent hanging
         
-        for chunk in world.get_loaded_chunks():
-            if chunks_rendered >= max_chunks_per_frame:
-                break
-                
+        for chunk in visible_chunks:
             try:
-                if chunk.dirty:
-                    self.update_chunk_mesh(chunk)
-                
-                if (chunk.x, chunk.z) in self.chunk_meshes:
-                    mesh = self.chunk_meshes[(chunk.x, chunk.z)]
-                    if mesh:
-                        # Set model matrix (identity for now)
-                        model_matrix = np.eye(4, dtype=np.float32)
-                        self.shader_program['model'].write(model_matrix.tobytes())
-                        mesh.render()
-                        chunks_rendered += 1
-                        
-                        # Debug: Log rendering info for first chunk only
-                        if self._debug_count <= 1 and chunk.x == 0 and chunk.z == 0:
-                            print(f"Rendered chunk ({chunk.x}, {chunk.z}) with {mesh.vertices} vertices")
-                        
+                mesh = self.chunk_meshes.get((chunk.x, chunk.z))
+                if mesh:
+                    self.chunk_offset.value = (chunk.x * CHUNK_SIZE, 0, chunk.z * CHUNK_SIZE)
+                    first_vertex, vertex_count, first_index, index_count = mesh
+                    self.vao.render(vertices=index_count, first=first_index)
+                    chunks_rendered += 1
+                    
+                    # Debug: Log rendering info for first chunk only
+                    if DEBUG and self.frame_count == 1 and chunk.x == 0 and chunk.z == 0:
+                        print(f"Rendered chunk ({chunk.x}, {chunk.z}) with {index_count} vertices")
+                    
             except Exception as e:
                 print(f"Error rendering chunk ({chunk.x}, {chunk.z}): {e}")
                 continue
                 
-        if self._debug_count <= 1:
+        if DEBUG and self.frame_count == 1:
             print(f"Total chunks rendered this frame: {chunks_rendered}")
     
-    def update_chunk_mesh(self, chunk):
-        """Update mesh for a chunk."""
-        vertices, indices = self.generate_chunk_mesh(chunk)
-        
-        if len(vertices) == 0:
-            # No visible blocks in chunk
-            self.chunk_meshes[(chunk.x, chunk.z)] = None
-            chunk.dirty = False
+    @staticmethod
+    def extract_frustum_planes(view_projection):
+        """Get the six frustum planes (a, b, c, d) of a row-vector view-projection matrix."""
+        columns = view_projection.T
+        planes = np.empty((6, 4), dtype=np.float32)
+        planes[0] = columns[3] + columns[0]  # Left
+        planes[1] = columns[3] - columns[0]  # Right
+        planes[2] = columns[3] + columns[1]  # Bottom
+        planes[3] = columns[3] - columns[1]  # Top
+        planes[4] = columns[3] + columns[2]  # Near
+        planes[5] = columns[3] - columns[2]  # Far
+        return planes
+    
+    def cull_chunks(self, chunks, planes):
+        """Return the chunks whose bounding boxes are at least partly inside the frustum."""
+        if not chunks:
+            return chunks
+        
+        box_min = np.zeros((len(chunks), 3), dtype=np.float32)
+        box_min[:, 0::2] = [(chunk.x, chunk.z) for chunk in chunks]
+        box_min *= CHUNK_SIZE
+        box_max = box_min + (CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE)
+        
+        # A box is outside when even its corner farthest along a plane normal is behind it
+        normals = planes[:, :3]
+        distances = np.maximum(box_min[:, None, :] * normals, box_max[:, None, :] * normals).sum(axis=2)
+        inside = (distances + planes[:, 3] >= 0).all(axis=1)
+        return [chunk for chunk, visible in zip(chunks, inside.tolist()) if visible]
+    
+    def upload_chunk_meshes(self, chunk_meshes):
+        """Upload (key, mesh) pairs with one write per buffer, replacing the old meshes."""
+        meshes = []
+        for key, mesh in chunk_meshes:
+            # Clean up old mesh if it exists
+            self.release_chunk_mesh(key)
+            
+            if len(mesh[0]) == 0:
+                # No visible blocks in chunk
+                self.chunk_meshes[key] = None
+                continue
+            
+            if DEBUG:
+                print(f"Chunk {key} mesh: {len(mesh[0])} vertices, {len(mesh[3])} indices")
+            meshes.append((key, mesh))
+        
+        if not meshes:
             return
         
-        # Create or update mesh using ModernGL efficiently
-        vertices_data = np.array(vertices, dtype=np.float32)
-        indices_data = np.array(indices, dtype=np.uint32)
-        
-        # Debug output for first chunk
-        if not hasattr(self, '_mesh_debug_done'):
-            self._mesh_debug_done = True
-            print(f"First chunk mesh: {len(vertices)} vertices, {len(indices)} indices")
-            print(f"Vertex data shape: {vertices_data.shape}")
-            print(f"Index data shape: {indices_data.shape}")
-            if len(vertices) > 0:
-                print(f"First vertex: {vertices_data[0]}")
-        
-        vertex_buffer = self.ctx.buffer(vertices_data.tobytes())
-        index_buffer = self.ctx.buffer(indices_data.tobytes())
-        
-        # Vertex array object with proper attribute layout
-        vao = self.ctx.vertex_array(self.shader_program, [
-            (vertex_buffer, '3f 4f 3f', 'position', 'color', 'normal')
-        ], index_buffer)
-        
-        # Store vertex count for debugging
-        vao.vertices = len(indices)
-        
-        # Clean up old mesh if it exists
-        old_mesh = self.chunk_meshes.get((chunk.x, chunk.z))
-        if old_mesh:
-            old_mesh.release()
-        
-        self.chunk_meshes[(chunk.x, chunk.z)] = vao
-        chunk.dirty = False
+        # Lay the chunks out back to back in one range of each shared buffer
+        vertex_count = sum(len(mesh[0]) for _, mesh in meshes)
+        index_count = sum(len(mesh[3]) for _, mesh in meshes)
+        first_vertex, first_index = self.allocate_mesh_ranges(vertex_count, index_count)
+        
+        indices = np.empty(index_count, dtype=np.uint32)
+        vertex, index = first_vertex, first_index
+        for key, (positions, colors, normals, chunk_indices) in meshes:
+            # Indices point into the shared buffers, so offset them by the chunk's first vertex
+            np.add(chunk_indices, vertex, out=indices[index - first_index:index - first_index + len(chunk_indices)])
+            self.chunk_meshes[key] = (vertex, len(positions), index, len(chunk_indices))
+            vertex += len(positions)
+            index += len(chunk_indices)
+        
+        # Meshes already come in their upload dtypes, so a lone chunk is written without any copy
+        if len(meshes) == 1:
+            positions, colors, normals, _ = meshes[0][1]
+        else:
+            positions = np.concatenate([mesh[0] for _, mesh in meshes])
+            colors = np.concatenate([mesh[1] for _, mesh in meshes])
+            normals = np.concatenate([mesh[2] for _, mesh in meshes])
+        self.position_buffer.write(positions, offset=first_vertex * 6)
+        self.color_buffer.write(colors, offset=first_vertex * 4)
+        self.normal_buffer.write(normals, offset=first_vertex * 4)
+        self.index_buffer.write(indices, offset=first_index * 4)
+    
+    def allocate_mesh_ranges(self, vertex_count, index_count):
+        """Reserve vertex and index ranges in the shared buffers, growing them if needed."""
+        first_vertex = self.vertex_allocator.allocate(vertex_count)
+        first_index = self.index_allocator.allocate(index_count)
+        if first_vertex is None or first_index is None:
+            if first_vertex is not None:
+                self.vertex_allocator.free(first_vertex, vertex_count)
+            if first_index is not None:
+                self.index_allocator.free(first_index, index_count)
+            self.grow_mesh_buffers(vertex_count, index_count)
+            first_vertex = self.vertex_allocator.allocate(vertex_count)
+            first_index = self.index_allocator.allocate(index_count)
+        return first_vertex, first_index
+    
+    def release_chunk_mesh(self, key):
+        """Free the buffer ranges of a chunk mesh."""
+        mesh = self.chunk_meshes.pop(key, None)
+        if mesh:
+            first_vertex, vertex_count, first_index, index_count = mesh
+            self.vertex_allocator.free(first_vertex, vertex_count)
+            self.index_allocator.free(first_index, index_count)
+    
+    def create_mesh_buffers(self, vertex_capacity, index_capacity):
+        """Create the shared chunk mesh buffers and the one vertex array drawing from them."""
+        # One buffer per attribute so position-only passes can bind just positions
+        self.position_buffer = self.ctx.buffer(reserve=vertex_capacity * 6)
+        self.color_buffer = self.ctx.buffer(reserve=vertex_capacity * 4)
+        self.normal_buffer = self.ctx.buffer(reserve=vertex_capacity * 4)
+        self.index_buffer = self.ctx.buffer(reserve=index_capacity * 4)
+        
+        self.vao = self.ctx.vertex_array(self.shader_program, [
+            (self.position_buffer, '3i2', 'position'),
+            (self.color_buffer, '4f1', 'color'),
+            (self.normal_buffer, '3i1 x1', 'normal')
+        ], self.index_buffer)
+    
+    def grow_mesh_buffers(self, vertex_count, index_count):
+        """Double the shared buffers until the given mesh fits, keeping existing meshes."""
+        vertex_capacity = self.vertex_allocator.capacity
+        index_capacity = self.index_allocator.capacity
+        while self.vertex_allocator.capacity + vertex_count > vertex_capacity:
+            vertex_capacity *= 2
+        while self.index_allocator.capacity + index_count > index_capacity:
+            index_capacity *= 2
+        
+        # Resize the existing buffers in place so the vertex array never has to be rebuilt
+        new_sizes = (vertex_capacity * 6, vertex_capacity * 4, vertex_capacity * 4, index_capacity * 4)
+        buffers = (self.position_buffer, self.color_buffer, self.normal_buffer, self.index_buffer)
+        for buffer, size in zip(buffers, new_sizes):
+            staging = self.ctx.buffer(reserve=buffer.size)
+            self.ctx.copy_buffer(staging, buffer)
+            buffer.orphan(size)
+            self.ctx.copy_buffer(buffer, staging)
+            staging.release()
+        
+        self.vertex_allocator.grow(vertex_capacity)
+        self.index_allocator.grow(index_capacity)
+        if DEBUG:
+            print(f"Grew chunk mesh buffers to {vertex_capacity} vertices, {index_capacity} indices")
     
     def generate_chunk_mesh(self, chunk):
         """Generate mesh data for a chunk."""
-        vertices = []
-        indices = []
-        index_offset = 0
-        blocks_processed = 0
-        visible_blocks = 0
-        max_blocks_per_chunk = CHUNK_SIZE * WORLD_HEIGHT * CHUNK_SIZE
-        
-        # Debug: Check first few blocks
-        debug_blocks = []
-        
-        for x in range(CHUNK_SIZE):
-            for y in range(WORLD_HEIGHT):
-                for z in range(CHUNK_SIZE):
-                    blocks_processed += 1
-                    if blocks_processed > max_blocks_per_chunk:
-                        print(f"Warning: Chunk mesh generation exceeded maximum blocks")
-                        break
-                        
-                    block_type = chunk.blocks[x, y, z]
-                    
-                    if block_type == 0:  # Air
-                        continue
-                    
-                    visible_blocks += 1
-                    world_x = chunk.x * CHUNK_SIZE + x
-                    world_z = chunk.z * CHUNK_SIZE + z
-                    
-                    # Debug: Store first few blocks
-                    if len(debug_blocks) < 3:
-                        debug_blocks.append({
-                            'local': (x, y, z),
-                            'world': (world_x, y, world_z),
-                            'type': block_type
-                        })
-                    
-                    # Check each face for visibility
-                    faces = self.get_visible_faces(chunk, x, y, z, world_x, world_z)
-                    
-                    if faces:
-                        block_vertices, block_indices = self.create_block_mesh(
-                            world_x, y, world_z, block_type, faces, index_offset
-                        )
-                        vertices.extend(block_vertices)
-                        indices.extend(block_indices)
-                        index_offset += len(block_vertices)
-                
-                if blocks_processed > max_blocks_per_chunk:
-                    break
-            if blocks_processed > max_blocks_per_chunk:
-                break
+        if NUMBA_AVAILABLE:
+            mesh = self.mesh_jit(chunk)
+        else:
+            mesh = self.mesh_numpy(chunk)
         
         # Debug output - focus on chunk (0,0) where the player starts
-        if visible_blocks > 0 and chunk.x == 0 and chunk.z == 0:
-            print(f"PLAYER CHUNK (0,0): {visible_blocks} blocks, {len(vertices)} vertices")
-            y_levels = set()
-            for block in debug_blocks:
-                y_levels.add(block['world'][1])
-                print(f"  Block at {block['local']} -> {block['world']}, type {block['type']}")
-            if len(debug_blocks) >= 3:
-                print(f"  Terrain Y levels in this sample: {sorted(y_levels)}")
-        
-        return np.array(vertices), np.array(indices)
+        if DEBUG and chunk.x == 0 and chunk.z == 0 and len(mesh[0]) > 0:
+            blocks = chunk.blocks.transpose(0, 2, 1)
+            print(f"PLAYER CHUNK (0,0): {np.count_nonzero(blocks)} blocks, {len(mesh[0])} vertices")
+            sample = np.argwhere(blocks)[:3]
+            for x, y, z in sample.tolist():
+                print(f"  Block at {(x, y, z)} -> {(x + chunk.x * CHUNK_SIZE, y, z + chunk.z * CHUNK_SIZE)}, type {blocks[x, y, z]}")
+            if len(sample) >= 3:
+                print(f"  Terrain Y levels in this sample: {sorted(set(sample[:, 1].tolist()))}")
+        
+        return mesh
     
-    def get_visible_faces(self, chunk, x, y, z, world_x, world_z):
-        """Determine which faces of a block are visible."""
-        faces = []
-        
-        # Check each direction
-        directions = [
-            (0, 1, 0),   # Top
-            (0, -1, 0),  # Bottom
-            (1, 0, 0),   # Right
-            (-1, 0, 0),  # Left
-            (0, 0, 1),   # Front
-            (0, 0, -1)   # Back
-        ]
-        
-        face_names = ['top', 'bottom', 'right', 'left', 'front', 'back']
-        
-        for i, (dx, dy, dz) in enumerate(directions):
-            neighbor_x, neighbor_y, neighbor_z = x + dx, y + dy, z + dz
-            
-            # Check if neighbor is air or transparent
-            if self.is_face_visible(chunk, neighbor_x, neighbor_y, neighbor_z, world_x + dx, world_z + dz):
-                faces.append(face_names[i])
-        
-        return faces
+    def mesh_jit(self, chunk):
+        """Greedy mesh a chunk with the compiled kernel into this thread's scratch buffers."""
+        positions, colors, normals, indices = self.get_mesh_scratch()
+        count = mesh_chunk(chunk.blocks, self.palette, positions, colors, normals, indices)
+        
+        # The finished mesh outlives this call (it waits for upload on the main thread),
+        # so only the used part is copied out and the scratch is free for the next chunk
+        return (positions[:count].copy(), colors[:count].copy(), normals[:count].copy(),
+                indices[:count // 4 * 6].copy())
     
-    def is_face_visible(self, chunk, x, y, z, world_x, world_z):
-        """Check if a face should be rendered."""
-        if y < 0 or y >= WORLD_HEIGHT:
-            return True  # Outside world bounds
-        
-        # Check within chunk first
-        if 0 <= x < CHUNK_SIZE and 0 <= z < CHUNK_SIZE:
-            neighbor_block = chunk.blocks[x, y, z]
-        else:
-            # Check adjacent chunk (simplified - assume air for now)
-            neighbor_block = 0
-        
-        return neighbor_block == 0 or neighbor_block == 6  # Air or water
+    def get_mesh_scratch(self):
+        """Get the calling thread's worst-case sized mesh buffers, allocating them on first use."""
+        scratch = getattr(self.mesh_scratch, 'buffers', None)
+        if scratch is None:
+            scratch = (np.empty((MAX_CHUNK_FACES * 4, 3), dtype=np.int16),
+                       np.empty((MAX_CHUNK_FACES * 4, 4), dtype=np.uint8),
+                       np.empty((MAX_CHUNK_FACES * 4, 4), dtype=np.int8),
+                       np.empty(MAX_CHUNK_FACES * 6, dtype=np.uint32))
+            self.mesh_scratch.buffers = scratch
+        return scratch
     
-    def create_block_mesh(self, x, y, z, block_type, faces, index_offset):
-        """Create mesh data for a single block."""
-        vertices = []
-        indices = []
-        
-        color = self.block_colors.get(block_type, (1, 1, 1, 1))
-        
-        # Face definitions
-        face_data = {
-            'top': {
-                'vertices': [
-                    [x, y+1, z], [x+1, y+1, z], [x+1, y+1, z+1], [x, y+1, z+1]
-                ],
-                'normal': [0, 1, 0],
-                'indices': [0, 1, 2, 0, 2, 3]
-            },
-            'bottom': {
-                'vertices': [
-                    [x, y, z+1], [x+1, y, z+1], [x+1, y, z], [x, y, z]
-                ],
-                'normal': [0, -1, 0],
-                'indices': [0, 1, 2, 0, 2, 3]
-            },
-            'right': {
-                'vertices': [
-                    [x+1, y, z], [x+1, y, z+1], [x+1, y+1, z+1], [x+1, y+1, z]
-                ],
-                'normal': [1, 0, 0],
-                'indices': [0, 1, 2, 0, 2, 3]
-            },
-            'left': {
-                'vertices': [
-                    [x, y, z+1], [x, y, z], [x, y+1, z], [x, y+1, z+1]
-                ],
-                'normal': [-1, 0, 0],
-                'indices': [0, 1, 2, 0, 2, 3]
-            },
-            'front': {
-                'vertices': [
-                    [x, y, z+1], [x+1, y, z+1], [x+1, y+1, z+1], [x, y+1, z+1]
-                ],
-                'normal': [0, 0, 1],
-                'indices': [0, 1, 2, 0, 2, 3]
-            },
-            'back': {
-                'vertices': [
-                    [x+1, y, z], [x, y, z], [x, y+1, z], [x+1, y+1, z]
-                ],
-                'normal': [0, 0, -1],
-                'indices': [0, 1, 2, 0, 2, 3]
-            }
-        }
-        
-        vertex_count = 0
-        for face in faces:
-            if face in face_data:
-                face_info = face_data[face]
-                
-                # Add vertices
-                for vertex in face_info['vertices']:
-                    vertices.append([
-                        vertex[0], vertex[1], vertex[2],  # Position
-                        color[0], color[1], color[2], color[3],  # Color
-                        face_info['normal'][0], face_info['normal'][1], face_info['normal'][2]  # Normal
-                    ])
-                
-                # Add indices
-                for idx in face_info['indices']:
-                    indices.append(index_offset + vertex_count + idx)
-                
-                vertex_count += 4
-        
-        return vertices, indices
+    def mesh_numpy(self, chunk):
+        """Mesh a chunk with vectorized face masks."""
+        blocks = chunk.blocks.transpose(0, 2, 1)  # View the [x, z, y] storage as [x, y, z]
+        solid = blocks != 0
+        
+        # Faces are visible against air or water; everything outside the chunk counts as air
+        transparent = np.ones((CHUNK_SIZE + 2, WORLD_HEIGHT + 2, CHUNK_SIZE + 2), dtype=bool)
+        transparent[1:-1, 1:-1, 1:-1] = (blocks == 0) | (blocks == 6)
+        
+        face_positions = []
+        face_colors = []
+        face_normals = []
+        
+        for face, (dx, dy, dz) in enumerate(FACE_DIRECTIONS):
+            # Shift the padded grid so each cell sees its neighbor in this direction
+            neighbor = transparent[1 + dx:1 + dx + CHUNK_SIZE,
+                                   1 + dy:1 + dy + WORLD_HEIGHT,
+                                   1 + dz:1 + dz + CHUNK_SIZE]
+            face_mask = solid & neighbor
+            coords = np.argwhere(face_mask)
+            if len(coords) == 0:
+                continue
+            
+            # One quad per visible face: block position plus the face template
+            # Built in int16 from the start so no second converting copy is needed
+            positions = coords.astype(np.int16)[:, None, :] + FACE_OFFSETS[face]
+            colors = np.repeat(self.palette[blocks[face_mask]], 4, axis=0)
+            face_positions.append(positions.reshape(-1, 3))
+            face_colors.append(colors)
+            face_normals.append(np.tile(FACE_NORMALS[face], (len(colors), 1)))
+        
+        if not face_positions:
+            return (np.empty((0, 3), dtype=np.int16), np.empty((0, 4), dtype=np.uint8),
+                    np.empty((0, 4), dtype=np.int8), np.empty(0, dtype=np.uint32))
+        
+        positions = np.concatenate(face_positions)
+        quad_starts = np.arange(0, len(positions), 4, dtype=np.uint32)
+        indices = (quad_starts[:, None] + QUAD_INDICES).ravel()
+        
+        return positions, np.concatenate(face_colors), np.concatenate(face_normals), indices
     
     def render_ui(self, player, hunter_system):
         """Render UI elements."""
@@ -396,10 +590,12 @@ class Renderer:
     
     def cleanup(self):
         """Clean up ModernGL resources."""
-        for mesh in self.chunk_meshes.values():
-            if mesh:
-                mesh.release()
+        self.mesh_pool.shutdown(wait=True, cancel_futures=True)
+        self.pending_meshes.clear()
         self.chunk_meshes.clear()
+        self.vao.release()
+        for buffer in (self.position_buffer, self.color_buffer, self.normal_buffer, self.index_buffer):
+            buffer.release()
         
         if hasattr(self, 'shader_program'):
             self.shader_program.release()
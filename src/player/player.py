@@ -50,12 +50,17 @@ class Player:
         # Apply physics
         self.apply_physics(delta_time)
         
-        # Update camera position
-        self.camera.position = self.position + np.array([0, PLAYER_HEIGHT * 0.8, 0])
+        # Update camera position in place (eye height above the feet)
+        camera_position = self.camera.position
+        camera_position[0] = self.position[0]
+        camera_position[1] = self.position[1] + PLAYER_HEIGHT * 0.8
+        camera_position[2] = self.position[2]
     
     def process_movement(self, delta_time, window):
         """Process player movement input."""
-        movement_vector = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+        # Horizontal movement direction, accumulated as scalars
+        move_x = move_z = 0.0
+        (front_x, _, front_z), (right_x, _, right_z), _, _ = self.camera.vectors.tolist()
         
         # Get current speed
         current_speed = self.speed
@@ -66,22 +71,25 @@ class Player:
         
         # Forward/backward movement
         if glfw.get_key(window, glfw.KEY_W) == glfw.PRESS:
-            movement_vector += self.camera.front
+            move_x += front_x
+            move_z += front_z
         if glfw.get_key(window, glfw.KEY_S) == glfw.PRESS:
-            movement_vector -= self.camera.front
+            move_x -= front_x
+            move_z -= front_z
         
         # Left/right movement
         if glfw.get_key(window, glfw.KEY_A) == glfw.PRESS:
-            movement_vector -= self.camera.right
+            move_x -= right_x
+            move_z -= right_z
         if glfw.get_key(window, glfw.KEY_D) == glfw.PRESS:
-            movement_vector += self.camera.right
+            move_x += right_x
+            move_z += right_z
         
         # Normalize movement vector (excluding Y component for flying)
-        movement_length = np.linalg.norm([movement_vector[0], movement_vector[2]])
-        if movement_length > 0:
-            movement_vector = self.normalize_horizontal(movement_vector)
-            self.velocity[0] = movement_vector[0] * current_speed
-            self.velocity[2] = movement_vector[2] * current_speed
+        if move_x != 0 or move_z != 0:
+            move_x, _, move_z = self.normalize_horizontal(move_x, 0.0, move_z)
+            self.velocity[0] = move_x * current_speed
+            self.velocity[2] = move_z * current_speed
         else:
             # Apply friction
             self.velocity[0] *= 0.8
@@ -100,20 +108,26 @@ class Player:
     
     def apply_physics(self, delta_time):
         """Apply physics to player movement."""
+        velocity_x, velocity_y, velocity_z = self.velocity.tolist()
+        
         # Apply gravity
         if not self.on_ground:
-            self.velocity[1] += GRAVITY * delta_time
+            velocity_y += GRAVITY * delta_time
         
-        # Update position
-        self.position += self.velocity * delta_time
+        # Update position in place, one axis at a time
+        position = self.position
+        position[0] += velocity_x * delta_time
+        position[1] += velocity_y * delta_time
+        position[2] += velocity_z * delta_time
         
         # Simple ground collision (temporary)
-        if self.position[1] < 65:  # Ground level
-            self.position[1] = 65
-            self.velocity[1] = 0
+        if position[1] < 65:  # Ground level
+            position[1] = 65
+            velocity_y = 0.0
             self.on_ground = True
         else:
             self.on_ground = False
+        self.velocity[1] = velocity_y
     
     def handle_key_input(self, key, action):
         """Handle key press events."""
@@ -149,38 +163,74 @@ class Player:
     
     def get_target_block(self, world):
         """Get the block the player is looking at."""
-        # Ray casting to find target block
-        ray_start = self.camera.position
-        ray_direction = self.camera.front
-        
-        # Step through ray
-        step_size = 0.1
-        for i in range(int(self.reach_distance / step_size)):
-            point = ray_start + ray_direction * (i * step_size)
-            block_x, block_y, block_z = int(point[0]), int(point[1]), int(point[2])
-            
-            if world.get_block(block_x, block_y, block_z) != 0:  # Not air
-                return (block_x, block_y, block_z)
-        
-        return None
+        hit = self.cast_ray(world, self.camera.position, self.camera.front, self.reach_distance)
+        return hit[0] if hit else None
     
     def get_target_block_adjacent(self, world):
         """Get the position adjacent to the target block for placing."""
-        target = self.get_target_block(world)
-        if not target:
+        hit = self.cast_ray(world, self.camera.position, self.camera.front, self.reach_distance)
+        if not hit:
             return None
         
-        # Find the face that was hit and place adjacent to it
-        # For now, just place above the target block
-        x, y, z = target
-        return (x, y + 1, z)
+        # Place against the face the ray entered through
+        (x, y, z), (nx, ny, nz) = hit
+        if nx == ny == nz == 0:
+            return None  # The ray started inside the block
+        return (x + nx, y + ny, z + nz)
+    
+    def cast_ray(self, world, origin, direction, max_distance):
+        """Walk the voxels along a ray (Amanatides-Woo DDA) up to max_distance.
+        
+        Returns ((x, y, z), (nx, ny, nz)) for the first solid block and the normal of
+        the face the ray entered it through, or None if nothing is hit.
+        """
+        ox, oy, oz = float(origin[0]), float(origin[1]), float(origin[2])
+        x, y, z = math.floor(ox), math.floor(oy), math.floor(oz)
+        if world.get_block(x, y, z) != 0:
+            return (x, y, z), (0, 0, 0)
+        
+        # Per axis: voxel step, ray distance between boundaries, distance to the next boundary
+        step_x, delta_x, next_x = self.ray_axis(ox, float(direction[0]))
+        step_y, delta_y, next_y = self.ray_axis(oy, float(direction[1]))
+        step_z, delta_z, next_z = self.ray_axis(oz, float(direction[2]))
+        
+        while True:
+            # Cross whichever voxel boundary the ray reaches first
+            if next_x < next_y and next_x < next_z:
+                distance = next_x
+                x += step_x
+                next_x += delta_x
+                normal = (-step_x, 0, 0)
+            elif next_y < next_z:
+                distance = next_y
+                y += step_y
+                next_y += delta_y
+                normal = (0, -step_y, 0)
+            else:
+                distance = next_z
+                z += step_z
+                next_z += delta_z
+                normal = (0, 0, -step_z)
+            
+            if distance > max_distance:
+                return None
+            if world.get_block(x, y, z) != 0:  # Not air
+                return (x, y, z), normal
+    
+    @staticmethod
+    def ray_axis(origin, direction):
+        """Get the DDA step, boundary spacing and first boundary distance along one axis."""
+        if direction > 0:
+            return 1, 1.0 / direction, (math.floor(origin) + 1 - origin) / direction
+        if direction < 0:
+            return -1, -1.0 / direction, (origin - math.floor(origin)) / -direction
+        return 0, math.inf, math.inf
     
     @staticmethod
-    def normalize_horizontal(vector):
-        """Normalize vector while keeping Y component."""
-        horizontal = np.array([vector[0], 0, vector[2]])
-        norm = np.linalg.norm(horizontal)
-        if norm == 0:
-            return vector
-        normalized_horizontal = horizontal / norm
-        return np.array([normalized_horizontal[0], vector[1], normalized_horizontal[2]])
+    def normalize_horizontal(x, y, z):
+        """Normalize the horizontal part of a vector while keeping Y component."""
+        length_squared = x * x + z * z
+        if length_squared == 0:
+            return x, y, z
+        inverse_length = 1.0 / math.sqrt(length_squared)
+        return x * inverse_length, y, z * inverse_length
@@ -6,29 +6,32 @@ Implements the hunter ranking, shadow soldiers, and abilities
 import numpy as np
 from ..core.config import *
 
+# Per-rank tables, indexed like HUNTER_RANKS
+RANK_MULTIPLIERS = (1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+RANK_UP_LEVELS = (10, 25, 50, 100, 200, float('inf'))  # Level needed to leave each rank
+
 class HunterRank:
     """Hunter rank system from Solo Leveling."""
     
     def __init__(self, rank="E"):
         """Initialize hunter rank."""
-        self.rank = rank
+        self.rank_index = HUNTER_RANKS.index(rank)
         self.level = 1
         self.experience = 0
         self.experience_to_next_level = 100
-        
-        # Rank multipliers
-        self.rank_multipliers = {
-            "E": 1.0,
-            "D": 1.5,
-            "C": 2.0,
-            "B": 3.0,
-            "A": 5.0,
-            "S": 10.0
-        }
+    
+    @property
+    def rank(self):
+        """Rank letter, from E up to S."""
+        return HUNTER_RANKS[self.rank_index]
+    
+    @rank.setter
+    def rank(self, value):
+        self.rank_index = HUNTER_RANKS.index(value)
     
     def get_multiplier(self):
         """Get the current rank multiplier."""
-        return self.rank_multipliers.get(self.rank, 1.0)
+        return RANK_MULTIPLIERS[self.rank_index]
     
     def add_experience(self, amount):
         """Add experience points."""
@@ -47,26 +50,17 @@ class HunterRank:
         if self.can_rank_up():
             self.rank_up()
         
-        print(f"Level up! Now level {self.level}")
+        if DEBUG:
+            print(f"Level up! Now level {self.level}")
     
     def can_rank_up(self):
         """Check if hunter can rank up."""
-        rank_thresholds = {
-            "E": 10,
-            "D": 25,
-            "C": 50,
-            "B": 100,
-            "A": 200
-        }
-        
-        threshold = rank_thresholds.get(self.rank, float('inf'))
-        return self.level >= threshold and self.rank != "S"
+        return self.level >= RANK_UP_LEVELS[self.rank_index]
     
     def rank_up(self):
         """Rank up the hunter."""
-        current_index = HUNTER_RANKS.index(self.rank)
-        if current_index < len(HUNTER_RANKS) - 1:
-            self.rank = HUNTER_RANKS[current_index + 1]
+        if self.rank_index < len(HUNTER_RANKS) - 1:
+            self.rank_index += 1
             print(f"Rank up! Now {self.rank}-rank hunter!")
 
 
@@ -81,9 +75,38 @@ class ShadowSoldier:
         self.health = 100 * level
         self.max_health = self.health
         self.attack_power = 20 * level
-        self.position = np.array([0.0, 0.0, 0.0])
-        self.is_active = False
         self.experience = 0
+        
+        # Position and active flag live in a row of arrays, shared by the whole army once bound
+        self.positions = np.zeros((1, 3), dtype=np.float32)
+        self.active = np.zeros(1, dtype=bool)
+        self.slot = 0
+    
+    @property
+    def position(self):
+        """World position, as a view into the shared position array."""
+        return self.positions[self.slot]
+    
+    @position.setter
+    def position(self, value):
+        self.positions[self.slot] = value
+    
+    @property
+    def is_active(self):
+        """Whether the soldier is summoned."""
+        return bool(self.active[self.slot])
+    
+    @is_active.setter
+    def is_active(self, value):
+        self.active[self.slot] = value
+    
+    def bind_slot(self, positions, active, slot):
+        """Move the position and active flag into row slot of shared arrays."""
+        positions[slot] = self.position
+        active[slot] = self.is_active
+        self.positions = positions
+        self.active = active
+        self.slot = slot
     
     def level_up(self):
         """Level up the shadow soldier."""
@@ -92,7 +115,8 @@ class ShadowSoldier:
         self.max_health = 100 * self.level
         self.health += (self.max_health - old_max_health)  # Heal on level up
         self.attack_power = 20 * self.level
-        print(f"{self.name} leveled up to {self.level}!")
+        if DEBUG:
+            print(f"{self.name} leveled up to {self.level}!")
     
     def add_experience(self, amount):
         """Add experience to shadow soldier."""
@@ -113,8 +137,26 @@ class Ability:
         self.mana_cost = mana_cost
         self.cooldown = cooldown
         self.description = description
-        self.current_cooldown = 0
         self.level = 1
+        
+        # Remaining cooldown lives in a slot of an array, shared by all abilities once bound
+        self.cooldowns = np.zeros(1, dtype=np.float32)
+        self.cooldown_index = 0
+    
+    @property
+    def current_cooldown(self):
+        """Seconds until the ability can be used again."""
+        return float(self.cooldowns[self.cooldown_index])
+    
+    @current_cooldown.setter
+    def current_cooldown(self, value):
+        self.cooldowns[self.cooldown_index] = value
+    
+    def bind_cooldown(self, cooldowns, index):
+        """Move the cooldown into slot index of a shared array."""
+        cooldowns[index] = self.current_cooldown
+        self.cooldowns = cooldowns
+        self.cooldown_index = index
     
     def can_use(self, player_mana):
         """Check if ability can be used."""
@@ -130,7 +172,7 @@ class Ability:
     def update(self, delta_time):
         """Update ability cooldown."""
         if self.current_cooldown > 0:
-            self.current_cooldown -= delta_time
+            self.current_cooldown = max(0.0, self.current_cooldown - delta_time)
 
 
 class HunterSystem:
@@ -142,6 +184,14 @@ class HunterSystem:
         self.shadow_soldiers = []
         self.max_shadow_soldiers = 5  # Starts low, increases with rank
         
+        # Soldier positions and active flags as parallel arrays, row i for shadow_soldiers[i]
+        self.shadow_positions = np.zeros((MAX_SHADOW_SOLDIERS, 3), dtype=np.float32)
+        self.shadow_active = np.zeros(MAX_SHADOW_SOLDIERS, dtype=bool)
+        
+        # Teleport offsets are drawn into a preallocated buffer from a local generator
+        self.rng = np.random.default_rng()
+        self.shadow_jitter = np.empty((MAX_SHADOW_SOLDIERS, 3), dtype=np.float32)
+        
         # Abilities
         self.abilities = {
             "shadow_extraction": Ability("Shadow Extraction", 30, 10.0, 
@@ -154,6 +204,11 @@ class HunterSystem:
                              "Become invisible for a short time")
         }
         
+        # All cooldowns in one array so update ticks them with a single vectorized op
+        self.ability_cooldowns = np.zeros(len(self.abilities), dtype=np.float32)
+        for index, ability in enumerate(self.abilities.values()):
+            ability.bind_cooldown(self.ability_cooldowns, index)
+        
         # Stats
         self.stats = {
             "strength": 10,
@@ -169,17 +224,26 @@ class HunterSystem:
     def update(self, delta_time, player):
         """Update hunter system."""
         # Update ability cooldowns
-        for ability in self.abilities.values():
-            ability.update(delta_time)
+        np.subtract(self.ability_cooldowns, delta_time, out=self.ability_cooldowns)
+        np.maximum(self.ability_cooldowns, 0.0, out=self.ability_cooldowns)
         
         # Update shadow soldiers
-        for soldier in self.shadow_soldiers:
-            if soldier.is_active:
-                # Simple AI: follow player
-                direction = player.position - soldier.position
-                if np.linalg.norm(direction) > 3.0:  # Too far, teleport closer
-                    soldier.position = player.position + np.random.uniform(-2, 2, 3)
-                    soldier.position[1] = player.position[1]  # Same height
+        n = len(self.shadow_soldiers)
+        if n:
+            # Simple AI: follow player, teleporting every active soldier that is too far closer
+            positions = self.shadow_positions[:n]
+            distances = np.linalg.norm(player.position - positions, axis=1)
+            far = self.shadow_active[:n] & (distances > 3.0)
+            count = np.count_nonzero(far)
+            if count:
+                # Offsets uniform in [-2, 2) around the player
+                jitter = self.shadow_jitter[:count]
+                self.rng.random(out=jitter, dtype=np.float32)
+                jitter *= 4.0
+                jitter += player.position
+                jitter -= 2.0
+                jitter[:, 1] = player.position[1]  # Same height
+                positions[far] = jitter
     
     def extract_shadow(self, enemy_type, enemy_level):
         """Extract a shadow from a defeated enemy."""
@@ -194,6 +258,7 @@ class HunterSystem:
         # Create shadow soldier
         soldier_name = f"Shadow {enemy_type.title()} #{len(self.shadow_soldiers) + 1}"
         shadow = ShadowSoldier(soldier_name, enemy_type, enemy_level)
+        shadow.bind_slot(self.shadow_positions, self.shadow_active, len(self.shadow_soldiers))
         self.shadow_soldiers.append(shadow)
         
         self.abilities["shadow_extraction"].use()
@@ -218,8 +283,7 @@ class HunterSystem:
             print("Not enough mana for Shadow Army!")
             return False
         
-        for soldier in self.shadow_soldiers:
-            soldier.is_active = True
+        self.shadow_active[:len(self.shadow_soldiers)] = True
         
         self.abilities["shadow_army"].use()
         print("Shadow Army summoned!")
@@ -263,4 +327,4 @@ class HunterSystem:
     
     def get_active_shadows_count(self):
         """Get number of active shadow soldiers."""
-        return sum(1 for soldier in self.shadow_soldiers if soldier.is_active)
+        return int(np.count_nonzero(self.shadow_active[:len(self.shadow_soldiers)]))
@@ -2,9 +2,70 @@
 World generation and management system
 """
 
+import math
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from opensimplex import OpenSimplex
 from ..core.config import *
+from ..core.jit import njit
+
+# Ore and feature placement runs compiled; each chunk passes its own seeded Generator
+@njit(cache=True, nogil=True)
+def place_ores(blocks, rng):
+    """Scatter coal, iron and diamond veins through the stone of a chunk."""
+    place_ore_veins(blocks, rng, rng.integers(5, 15), 60, 9, 3)  # Coal ore
+    place_ore_veins(blocks, rng, rng.integers(3, 8), 40, 10, 2)  # Iron ore
+    place_ore_veins(blocks, rng, rng.integers(1, 3), 20, 12, 1)  # Diamond ore
+
+@njit(cache=True, nogil=True)
+def place_ore_veins(blocks, rng, count, max_y, ore_type, size):
+    """Grow veins of ore from random stone blocks between y=5 and max_y."""
+    # Draw every start and offset in a few batched calls
+    xs = rng.integers(0, CHUNK_SIZE, size=count)
+    ys = rng.integers(5, max_y, size=count)
+    zs = rng.integers(0, CHUNK_SIZE, size=count)
+    offsets_xz = rng.integers(-2, 3, size=(count, size, 2))
+    offsets_y = rng.integers(-1, 2, size=(count, size))
+    
+    for i in range(count):
+        if blocks[xs[i], zs[i], ys[i]] != 3:  # Veins start in stone
+            continue
+        for j in range(size):
+            x = xs[i] + offsets_xz[i, j, 0]
+            y = ys[i] + offsets_y[i, j]
+            z = zs[i] + offsets_xz[i, j, 1]
+            if (0 <= x < CHUNK_SIZE and 0 <= y < WORLD_HEIGHT and
+                    0 <= z < CHUNK_SIZE and blocks[x, z, y] == 3):
+                blocks[x, z, y] = ore_type
+
+@njit(cache=True, nogil=True)
+def place_solo_leveling_features(blocks, rng):
+    """Place shadow stones and mana crystals, and return whether a gate should spawn."""
+    place_in_stone(blocks, rng, rng.integers(0, 2), 5, 30, 13)  # Shadow stones (rare)
+    place_in_stone(blocks, rng, rng.integers(1, 4), 10, 50, 15)  # Mana crystals (magical ore)
+    return rng.random() < GATE_SPAWN_CHANCE
+
+@njit(cache=True, nogil=True)
+def place_in_stone(blocks, rng, count, min_y, max_y, block_type):
+    """Replace up to count random blocks between min_y and max_y that are stone."""
+    xs = rng.integers(0, CHUNK_SIZE, size=count)
+    ys = rng.integers(min_y, max_y, size=count)
+    zs = rng.integers(0, CHUNK_SIZE, size=count)
+    for i in range(count):
+        if blocks[xs[i], zs[i], ys[i]] == 3:  # Stone
+            blocks[xs[i], zs[i], ys[i]] = block_type
+
+# Gate structure above the surface, indexed [x - 1 .. x + 1, height]: a 3 wide, 5 tall
+# frame of gate stone (14) around an air portal (0)
+GATE_TEMPLATE = np.array([
+    [14, 14, 14, 14, 14],
+    [0, 0, 0, 0, 14],
+    [14, 14, 14, 14, 14],
+], dtype=np.uint8)
+
 
 class Chunk:
     """A chunk of the world containing blocks."""
@@ -13,48 +74,58 @@ class Chunk:
         """Initialize a chunk at given coordinates."""
         self.x = x
         self.z = z
-        self.blocks = np.zeros((CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE), dtype=np.uint8)
+        # Indexed [x, z, y] so each column is contiguous in memory
+        self.blocks = np.zeros((CHUNK_SIZE, CHUNK_SIZE, WORLD_HEIGHT), dtype=np.uint8)
+        self.blocks_flat = self.blocks.reshape(-1)  # Same memory, indexed by block_index(x, y, z)
+        self.packed_blocks = None  # Two block ids per byte while the chunk sits unloaded in the cache
         self.generated = False
-        self.dirty = True  # Needs mesh update
     
-    def generate_terrain(self, world_seed=0):
-        """Generate terrain for this chunk."""
-        if self.generated:
+    @staticmethod
+    def block_index(x, y, z):
+        """Get the flat index of a local block position."""
+        return (x * CHUNK_SIZE + z) * WORLD_HEIGHT + y
+    
+    def pack(self):
+        """Halve the chunk's memory by storing block ids as nibbles, if they all fit in 4 bits."""
+        if self.packed_blocks is not None or self.blocks_flat.max() > 0xF:
             return
         
-        # Initialize noise generator
-        noise_gen = OpenSimplex(seed=world_seed)
+        # Even flat indices go in the low nibble, odd ones in the high nibble
+        self.packed_blocks = self.blocks_flat[0::2] | (self.blocks_flat[1::2] << 4)
+        self.blocks = self.blocks_flat = None
+    
+    def unpack(self):
+        """Restore the byte per block storage of a packed chunk."""
+        if self.packed_blocks is None:
+            return
+        
+        self.blocks_flat = np.empty(self.packed_blocks.size * 2, dtype=np.uint8)
+        np.bitwise_and(self.packed_blocks, 0xF, out=self.blocks_flat[0::2])
+        np.right_shift(self.packed_blocks, 4, out=self.blocks_flat[1::2])
+        self.blocks = self.blocks_flat.reshape(CHUNK_SIZE, CHUNK_SIZE, WORLD_HEIGHT)
+        self.packed_blocks = None
+    
+    def generate_terrain(self, noise_gen, world_seed=0, heights=None):
+        """Generate terrain for this chunk using the world's noise generator (or a precomputed height map)."""
+        if self.generated:
+            return
         
         # Generate height map using OpenSimplex noise
-        for local_x in range(CHUNK_SIZE):
-            for local_z in range(CHUNK_SIZE):
-                world_x = self.x * CHUNK_SIZE + local_x
-                world_z = self.z * CHUNK_SIZE + local_z
-                
-                # Generate height using multiple octaves of noise
-                height = self.get_height(world_x, world_z, noise_gen)
-                
-                # Fill blocks based on height
-                for y in range(int(height)):
-                    if y < SEA_LEVEL - 50:
-                        # Deep underground - stone
-                        self.blocks[local_x, y, local_z] = 3  # Stone
-                    elif y < height - 3:
-                        # Underground - dirt
-                        self.blocks[local_x, y, local_z] = 2  # Dirt
-                    elif y < height:
-                        if height > SEA_LEVEL:
-                            # Surface - grass
-                            self.blocks[local_x, y, local_z] = 1  # Grass
-                        else:
-                            # Below sea level - sand
-                            self.blocks[local_x, y, local_z] = 7  # Sand
-                
-                # Add water at sea level
-                if height < SEA_LEVEL:
-                    for y in range(int(height), SEA_LEVEL):
-                        if self.blocks[local_x, y, local_z] == 0:
-                            self.blocks[local_x, y, local_z] = 6  # Water
+        if heights is None:
+            heights = self.get_heights(noise_gen)
+        
+        # Fill whole columns at once by comparing every y level against the column height
+        ys = np.arange(WORLD_HEIGHT)[None, None, :]
+        column_heights = heights[:, :, None]
+        ground = ys < np.floor(column_heights)
+        surface = np.where(column_heights > SEA_LEVEL, 1, 7)  # Grass above sea level, sand below
+        layers = np.where(ys < SEA_LEVEL - 50, 3,  # Deep underground - stone
+                          np.where(ys < column_heights - 3, 2, surface))  # Underground - dirt
+        self.blocks[ground] = layers[ground]
+        
+        # Add water at sea level
+        water = ~ground & (ys < SEA_LEVEL) & (column_heights < SEA_LEVEL)
+        self.blocks[water] = 6  # Water
         
         # Add ores
         self.generate_ores(world_seed)
@@ -63,109 +134,62 @@ class Chunk:
         self.generate_solo_leveling_features(world_seed)
         
         self.generated = True
-        self.dirty = True
     
-    def get_height(self, x, z, noise_gen):
-        """Get terrain height at world coordinates."""
+    def get_heights(self, noise_gen):
+        """Get the terrain height of every column in the chunk, indexed [local_x, local_z]."""
+        xs = self.x * CHUNK_SIZE + np.arange(CHUNK_SIZE, dtype=np.float64)
+        zs = self.z * CHUNK_SIZE + np.arange(CHUNK_SIZE, dtype=np.float64)
+        
+        # noise2array evaluates the whole grid natively, indexed [z, x], hence the transpose;
+        # both octaves are scaled and summed in place in the base terrain's array
         # Base terrain
-        height = noise_gen.noise2(x * 0.01, z * 0.01) * 50 + SEA_LEVEL
+        heights = noise_gen.noise2array(xs * 0.01, zs * 0.01)
+        heights *= 50
+        heights += SEA_LEVEL
         
         # Add hills with different frequency
-        hills = noise_gen.noise2(x * 0.005, z * 0.005) * 30
+        hills = noise_gen.noise2array(xs * 0.005, zs * 0.005)
+        hills *= 30
+        heights += hills
         
-        return max(1, height + hills)
+        return np.maximum(heights, 1, out=heights).T
     
     def generate_ores(self, seed):
         """Generate ore deposits in the chunk."""
-        np.random.seed(seed + self.x * 1000 + self.z)
-        
-        # Coal ore
-        for _ in range(np.random.randint(5, 15)):
-            x, y, z = (np.random.randint(0, CHUNK_SIZE),
-                      np.random.randint(5, 60),
-                      np.random.randint(0, CHUNK_SIZE))
-            if self.blocks[x, y, z] == 3:  # Stone
-                self.generate_ore_vein(x, y, z, 9, 3)  # Coal ore
-        
-        # Iron ore
-        for _ in range(np.random.randint(3, 8)):
-            x, y, z = (np.random.randint(0, CHUNK_SIZE),
-                      np.random.randint(5, 40),
-                      np.random.randint(0, CHUNK_SIZE))
-            if self.blocks[x, y, z] == 3:  # Stone
-                self.generate_ore_vein(x, y, z, 10, 2)  # Iron ore
-        
-        # Diamond ore
-        for _ in range(np.random.randint(1, 3)):
-            x, y, z = (np.random.randint(0, CHUNK_SIZE),
-                      np.random.randint(5, 20),
-                      np.random.randint(0, CHUNK_SIZE))
-            if self.blocks[x, y, z] == 3:  # Stone
-                self.generate_ore_vein(x, y, z, 12, 1)  # Diamond ore
-    
-    def generate_ore_vein(self, start_x, start_y, start_z, ore_type, size):
-        """Generate a vein of ore around a starting position."""
-        for _ in range(size):
-            x = start_x + np.random.randint(-2, 3)
-            y = start_y + np.random.randint(-1, 2)
-            z = start_z + np.random.randint(-2, 3)
-            
-            if (0 <= x < CHUNK_SIZE and 0 <= y < WORLD_HEIGHT and 
-                0 <= z < CHUNK_SIZE and self.blocks[x, y, z] == 3):
-                self.blocks[x, y, z] = ore_type
+        place_ores(self.blocks, self.get_rng(seed, 0))
     
     def generate_solo_leveling_features(self, seed):
         """Generate Solo Leveling specific features."""
-        np.random.seed(seed + self.x * 2000 + self.z * 3000)
-        
-        # Shadow stones (rare)
-        for _ in range(np.random.randint(0, 2)):
-            x, y, z = (np.random.randint(0, CHUNK_SIZE),
-                      np.random.randint(5, 30),
-                      np.random.randint(0, CHUNK_SIZE))
-            if self.blocks[x, y, z] == 3:  # Stone
-                self.blocks[x, y, z] = 13  # Shadow stone
-        
-        # Mana crystals (magical ore)
-        for _ in range(np.random.randint(1, 4)):
-            x, y, z = (np.random.randint(0, CHUNK_SIZE),
-                      np.random.randint(10, 50),
-                      np.random.randint(0, CHUNK_SIZE))
-            if self.blocks[x, y, z] == 3:  # Stone
-                self.blocks[x, y, z] = 15  # Mana crystal
+        rng = self.get_rng(seed, 1)
         
         # Gate spawn chance (very rare)
-        if np.random.random() < GATE_SPAWN_CHANCE:
-            self.spawn_gate()
+        if place_solo_leveling_features(self.blocks, rng):
+            self.spawn_gate(rng)
     
-    def spawn_gate(self):
+    def get_rng(self, seed, stream):
+        """Get a generator local to this chunk, seeded from the world seed and a stream id."""
+        # Mixed by SeedSequence, which only takes non-negative entropy, so negative coords are wrapped
+        return np.random.default_rng([seed & 0xFFFFFFFF, self.x & 0xFFFFFFFF, self.z & 0xFFFFFFFF, stream])
+    
+    def spawn_gate(self, rng):
         """Spawn a dungeon gate in this chunk."""
         # Find a suitable surface location
         for attempt in range(10):
-            x, z = np.random.randint(2, CHUNK_SIZE-2), np.random.randint(2, CHUNK_SIZE-2)
+            x, z = rng.integers(2, CHUNK_SIZE-2), rng.integers(2, CHUNK_SIZE-2)
+            
+            # Find surface height: the highest non-air block above the bottom layer
+            solid = np.flatnonzero(self.blocks[x, z, 1:])
+            if len(solid) == 0:
+                continue
+            y = int(solid[-1]) + 1
+            
+            # Clear area and build gate with one slice assignment, dropping the part above the world
+            height = min(GATE_TEMPLATE.shape[1], WORLD_HEIGHT - (y + 1))
+            self.blocks[x-1:x+2, z, y+1:y+1+height] = GATE_TEMPLATE[:, :height]
             
-            # Find surface height
-            for y in range(WORLD_HEIGHT-1, 0, -1):
-                if self.blocks[x, y, z] != 0:  # Not air
-                    # Create gate structure
-                    gate_height = 5
-                    gate_width = 3
-                    
-                    # Clear area and build gate
-                    for gx in range(gate_width):
-                        for gy in range(gate_height):
-                            gate_x = x - 1 + gx
-                            gate_y = y + 1 + gy
-                            
-                            if (0 <= gate_x < CHUNK_SIZE and 
-                                0 <= gate_y < WORLD_HEIGHT):
-                                if gx == 0 or gx == gate_width-1 or gy == gate_height-1:
-                                    self.blocks[gate_x, gate_y, z] = 14  # Gate stone
-                                else:
-                                    self.blocks[gate_x, gate_y, z] = 0  # Air (portal)
-                    
-                    print(f"Gate spawned in chunk ({self.x}, {self.z}) at ({x}, {y+1}, {z})")
-                    return
+            if DEBUG:
+                print(f"Gate spawned in chunk ({self.x}, {self.z}) at ({x}, {y+1}, {z})")
+            return
 
 
 class World:
@@ -173,60 +197,119 @@ class World:
     
     def __init__(self, seed=None):
         """Initialize the world."""
-        self.seed = seed or np.random.randint(0, 1000000)
-        self.chunks = {}
+        self.seed = seed or int(np.random.default_rng().integers(0, 1000000))
+        self.noise = OpenSimplex(seed=self.seed)  # Shared by all chunks; building one is not free
+        
+        # OpenSimplex's array noise is a parallel Numba kernel: run it once here so Numba's
+        # threading layer starts on the main thread (starting it from a worker hangs on exit),
+        # and never launch it from two workers at once (the default workqueue layer aborts)
+        self.noise.noise2array(np.zeros(1), np.zeros(1))
+        self.noise_lock = threading.Lock()
+        self.chunks = OrderedDict()  # Least recently used first, capped at MAX_CACHED_CHUNKS
         self.loaded_chunks = set()
+        self.dirty_chunks = set()  # Chunk coords whose meshes need rebuilding
+        
+        # Chunk hit by the last get_block/set_block, reused while queries stay inside it
+        self.last_chunk_x = self.last_chunk_z = None
+        self.last_chunk = None
+        
+        # Load window around the player, only recomputed when the player changes chunk
+        self.player_chunk = None
+        self.chunks_to_load = deque()
+        
+        # New chunks in the window are generated on worker threads (the compiled
+        # placement kernels and most NumPy passes release the GIL)
+        self.generation_pool = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1))
+        self.pending_chunks = {}  # Chunk coords -> future of the chunk being generated
         
         print(f"World initialized with seed: {self.seed}")
     
     def get_chunk_coords(self, x, z):
         """Get chunk coordinates from world coordinates."""
-        return int(x // CHUNK_SIZE), int(z // CHUNK_SIZE)
+        return math.floor(x) >> CHUNK_SHIFT, math.floor(z) >> CHUNK_SHIFT
     
     def get_chunk(self, chunk_x, chunk_z):
         """Get or create a chunk."""
         coords = (chunk_x, chunk_z)
         
-        if coords not in self.chunks:
-            chunk = Chunk(chunk_x, chunk_z)
-            chunk.generate_terrain(self.seed)
-            self.chunks[coords] = chunk
+        chunk = self.chunks.get(coords)
+        if chunk is not None:
+            self.chunks.move_to_end(coords)
+            chunk.unpack()
+            return chunk
+        
+        return self.add_chunk(self.generate_chunk(chunk_x, chunk_z))
+    
+    def generate_chunk(self, chunk_x, chunk_z):
+        """Create and generate a chunk without adding it to the world (safe on worker threads)."""
+        chunk = Chunk(chunk_x, chunk_z)
+        with self.noise_lock:
+            heights = chunk.get_heights(self.noise)
+        chunk.generate_terrain(self.noise, self.seed, heights)
+        return chunk
+    
+    def add_chunk(self, chunk):
+        """Add a generated chunk to the cache, keeping one already there, and return the cached chunk."""
+        coords = (chunk.x, chunk.z)
+        if coords in self.chunks:
+            # Created on demand (e.g. by get_block) while this one was generating
+            chunk = self.chunks[coords]
+            chunk.unpack()
+            return chunk
         
-        return self.chunks[coords]
+        self.chunks[coords] = chunk
+        self.evict_chunks()
+        return chunk
+    
+    def evict_chunks(self):
+        """Drop the least recently used unloaded chunks until the cache is within its cap."""
+        while len(self.chunks) > max(MAX_CACHED_CHUNKS, len(self.loaded_chunks)):
+            coords = next(iter(self.chunks))
+            if coords in self.loaded_chunks:
+                # Loaded chunks are never evicted, just passed over
+                self.chunks.move_to_end(coords)
+            else:
+                del self.chunks[coords]
+                self.forget_last_chunk()
     
     def get_block(self, x, y, z):
         """Get block type at world coordinates."""
         if y < 0 or y >= WORLD_HEIGHT:
             return 0  # Air
         
-        chunk_x, chunk_z = self.get_chunk_coords(x, z)
-        chunk = self.get_chunk(chunk_x, chunk_z)
-        
-        local_x = x - chunk_x * CHUNK_SIZE
-        local_z = z - chunk_z * CHUNK_SIZE
+        # Block coords are integers, so the chunk coords are a shift away
+        chunk_x, chunk_z = x >> CHUNK_SHIFT, z >> CHUNK_SHIFT
+        if chunk_x == self.last_chunk_x and chunk_z == self.last_chunk_z:
+            chunk = self.last_chunk
+        else:
+            chunk = self.get_chunk(chunk_x, chunk_z)
+            self.last_chunk_x, self.last_chunk_z, self.last_chunk = chunk_x, chunk_z, chunk
         
-        if 0 <= local_x < CHUNK_SIZE and 0 <= local_z < CHUNK_SIZE:
-            return chunk.blocks[local_x, y, local_z]
-        
-        return 0  # Air
+        return chunk.blocks_flat[Chunk.block_index(x & CHUNK_MASK, y, z & CHUNK_MASK)]
     
     def set_block(self, x, y, z, block_type):
         """Set block type at world coordinates."""
         if y < 0 or y >= WORLD_HEIGHT:
             return False
         
-        chunk_x, chunk_z = self.get_chunk_coords(x, z)
-        chunk = self.get_chunk(chunk_x, chunk_z)
-        
-        local_x = x - chunk_x * CHUNK_SIZE
-        local_z = z - chunk_z * CHUNK_SIZE
-        
-        if 0 <= local_x < CHUNK_SIZE and 0 <= local_z < CHUNK_SIZE:
-            chunk.blocks[local_x, y, local_z] = block_type
-            chunk.dirty = True
-            return True
+        # Block coords are integers, so the chunk coords are a shift away
+        chunk_x, chunk_z = x >> CHUNK_SHIFT, z >> CHUNK_SHIFT
+        if chunk_x == self.last_chunk_x and chunk_z == self.last_chunk_z:
+            chunk = self.last_chunk
+        else:
+            chunk = self.get_chunk(chunk_x, chunk_z)
+            self.last_chunk_x, self.last_chunk_z, self.last_chunk = chunk_x, chunk_z, chunk
         
-        return False
+        chunk.blocks_flat[Chunk.block_index(x & CHUNK_MASK, y, z & CHUNK_MASK)] = block_type
+        # Only loaded chunks have meshes; the rest are remeshed when they load
+        if (chunk_x, chunk_z) in self.loaded_chunks:
+            self.dirty_chunks.add((chunk_x, chunk_z))
+        return True
+    
+    def forget_last_chunk(self):
+        """Drop the chunk cached by get_block/set_block (after it is packed or evicted)."""
+        self.last_chunk_x = self.last_chunk_z = None
+        self.last_chunk = None
     
     def update(self, player_position):
         """Update world around player position."""
@@ -234,45 +317,100 @@ class World:
             player_position[0], player_position[2]
         )
         
+        # Nothing to do while the player stays in the same chunk and no chunks are loading
+        if ((player_chunk_x, player_chunk_z) == self.player_chunk
+                and not self.chunks_to_load and not self.pending_chunks):
+            return
+        
         # Debug output
-        if not hasattr(self, '_debug_player_chunk'):
+        if DEBUG and not hasattr(self, '_debug_player_chunk'):
             self._debug_player_chunk = True
             print(f"Player at {player_position[0]:.1f}, {player_position[2]:.1f} -> chunk ({player_chunk_x}, {player_chunk_z})")
         
-        # Load chunks around player (limit per frame to prevent hanging)
-        chunks_loaded_this_frame = 0
-        max_chunks_per_frame = 2  # Limit chunk generation per frame
+        # The window only moves when the player crosses into another chunk
+        if (player_chunk_x, player_chunk_z) != self.player_chunk:
+            self.move_window((player_chunk_x, player_chunk_z))
         
-        for dx in range(-RENDER_DISTANCE, RENDER_DISTANCE + 1):
-            for dz in range(-RENDER_DISTANCE, RENDER_DISTANCE + 1):
-                if chunks_loaded_this_frame >= max_chunks_per_frame:
-                    break
-                    
-                chunk_x = player_chunk_x + dx
-                chunk_z = player_chunk_z + dz
-                
-                coords = (chunk_x, chunk_z)
-                if coords not in self.loaded_chunks:
-                    self.get_chunk(chunk_x, chunk_z)
-                    self.loaded_chunks.add(coords)
-                    chunks_loaded_this_frame += 1
-            
-            if chunks_loaded_this_frame >= max_chunks_per_frame:
-                break
+        # Load the chunks the workers have finished, if they are still in the window
+        for coords in [coords for coords, future in self.pending_chunks.items() if future.done()]:
+            try:
+                self.add_chunk(self.pending_chunks.pop(coords).result())
+            except Exception as e:
+                print(f"Error generating chunk {coords}: {e}")
+                continue
+            if self.in_window(coords):
+                self.load_chunk(coords)
         
-        # Unload distant chunks
-        chunks_to_unload = []
-        for coords in self.loaded_chunks:
-            chunk_x, chunk_z = coords
-            distance = max(abs(chunk_x - player_chunk_x), abs(chunk_z - player_chunk_z))
-            if distance > RENDER_DISTANCE + 2:
-                chunks_to_unload.append(coords)
-        
-        for coords in chunks_to_unload:
-            self.loaded_chunks.discard(coords)
+        # Load cached chunks right away and hand the rest to the workers
+        max_pending_chunks = 8  # Limit chunks generating at once to bound memory use
+        while self.chunks_to_load and len(self.pending_chunks) < max_pending_chunks:
+            coords = self.chunks_to_load.popleft()
             if coords in self.chunks:
-                del self.chunks[coords]
+                self.load_chunk(coords)
+            else:
+                self.pending_chunks[coords] = self.generation_pool.submit(self.generate_chunk, *coords)
+    
+    def load_chunk(self, coords):
+        """Mark a cached chunk as loaded."""
+        self.chunks.move_to_end(coords)
+        self.chunks[coords].unpack()
+        self.loaded_chunks.add(coords)
+        self.dirty_chunks.add(coords)  # Meshed on load; cached chunks lost their mesh when unloaded
+    
+    def in_window(self, coords):
+        """Check whether chunk coords are within the render distance of the player's chunk."""
+        return (max(abs(coords[0] - self.player_chunk[0]), abs(coords[1] - self.player_chunk[1]))
+                <= RENDER_DISTANCE)
+    
+    def move_window(self, player_chunk):
+        """Queue the chunks entering the render window and unload those leaving it."""
+        old_chunk, self.player_chunk = self.player_chunk, player_chunk
+        if old_chunk is None:
+            entering = self.window_delta(None, player_chunk, RENDER_DISTANCE)
+            leaving = ()
+        else:
+            entering = self.window_delta(old_chunk, player_chunk, RENDER_DISTANCE)
+            # Chunks stay loaded until they are 2 chunks past the render distance
+            leaving = self.window_delta(player_chunk, old_chunk, RENDER_DISTANCE + 2)
+        
+        # Unload distant chunks, keeping them cached (packed) in case the player comes back
+        for coords in leaving:
+            if coords in self.loaded_chunks:
+                self.loaded_chunks.discard(coords)
+                self.dirty_chunks.discard(coords)
+                if coords in self.chunks:
+                    self.chunks.move_to_end(coords)
+                    self.chunks[coords].pack()
+                    self.forget_last_chunk()
+        
+        # Drop queued chunks that fell out of the window, then queue the new ones
+        self.chunks_to_load = deque(coords for coords in self.chunks_to_load if self.in_window(coords))
+        self.chunks_to_load.extend(coords for coords in entering
+                                   if coords not in self.loaded_chunks and coords not in self.pending_chunks)
+    
+    @staticmethod
+    def window_delta(old_center, new_center, radius):
+        """Yield the chunk coords within radius of new_center that are farther than radius from old_center."""
+        center_x, center_z = new_center
+        for chunk_x in range(center_x - radius, center_x + radius + 1):
+            z_range = range(center_z - radius, center_z + radius + 1)
+            if old_center is None or abs(chunk_x - old_center[0]) > radius:
+                # The whole column is new
+                yield from ((chunk_x, chunk_z) for chunk_z in z_range)
+                continue
+            
+            # Only the ends of the column past the old window are new
+            old_z = old_center[1]
+            below = range(z_range.start, min(z_range.stop, old_z - radius))
+            above = range(max(z_range.start, old_z + radius + 1), z_range.stop)
+            yield from ((chunk_x, chunk_z) for chunk_z in below)
+            yield from ((chunk_x, chunk_z) for chunk_z in above)
     
     def get_loaded_chunks(self):
         """Get all loaded chunks."""
         return [self.chunks[coords] for coords in self.loaded_chunks if coords in self.chunks]
+    
+    def cleanup(self):
+        """Stop the chunk generation workers."""
+        self.generation_pool.shutdown(wait=True, cancel_futures=True)
+        self.pending_chunks.clear()